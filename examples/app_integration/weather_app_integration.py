@@ -106,7 +106,7 @@ class WeatherClientEntity(Entity):
         
     async def process_message(self, message, context):
         """Process responses from the weather service"""
-        print(f"{self.name} received: {json.dumps(message.content, indent=2)}")
+        print(f"{self.name} received: {json.dumps(message.content, separators=(',', ':'))}")
         self.responses.append(message)
         return None
 
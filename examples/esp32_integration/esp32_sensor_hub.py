@@ -135,7 +135,7 @@ async def main():
                 sensor_data_history.pop(0)
             
             # Log the data
-            logger.info(f"Sensor readings: {json.dumps(sensor_data, indent=2)}")
+            logger.info(f"Sensor readings: {json.dumps(sensor_data, separators=(',', ':'))}")
             
             # Send to Azure IoT Hub (if configured)
             """
@@ -409,7 +409,7 @@ async def main():
         print(f"Event {i+1}:")
         print(f"  Topic: {event.get('topic')}")
         print(f"  Publisher: {event.get('publisher')}")
-        print(f"  Data: {json.dumps(event.get('data'), indent=2)}")
+        print(f"  Data: {json.dumps(event.get('data'), separators=(',', ':'))}")
 
 if __name__ == "__main__":
     asyncio.run(main())
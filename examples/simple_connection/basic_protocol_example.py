@@ -10,33 +10,49 @@ without any LLM integration or advanced features. It shows how to:
 """
 
 import asyncio
+from collections import deque
 from regennexus.protocol.protocol_core import Message, Entity, Intent
 from regennexus.registry.registry import Registry
 from regennexus.context.context_manager import ContextManager
+from regennexus.protocol.runtime import install_uvloop
+
+def _make(sender, recipient, content, intent, ctx):
+    """Build a protocol message for this example"""
+    return Message(sender, recipient, content, intent, ctx)
 
 # Create a simple entity class
 class SimpleEntity(Entity):
+    # Intent -> handler method name; one dict lookup per message
+    _HANDLERS = {
+        "query": "_handle_query",
+    }
+    
     def __init__(self, entity_id, name):
         super().__init__(entity_id)
         self.name = name
-        self.received_messages = []
+        # Bounded history: keeps the most recent messages without unbounded growth
+        self.received_messages = deque(maxlen=1024)
         
     async def process_message(self, message, context):
         """Process an incoming message"""
         print(f"{self.name} received: {message.content}")
         self.received_messages.append(message)
         
-        # If this is a query, send a response
-        if message.intent == "query":
-            response = Message(
-                sender_id=self.id,
-                recipient_id=message.sender_id,
-                content=f"Response from {self.name}: I received your query",
-                intent="response",
-                context_id=message.context_id
-            )
-            return response
-        return None
+        # Dispatch on intent; intents without a handler get no response
+        handler = self._HANDLERS.get(message.intent)
+        if handler is None:
+            return None
+        return await getattr(self, handler)(message, context)
+    
+    async def _handle_query(self, message, context):
+        """Respond to a query"""
+        return _make(
+            self.id,
+            message.sender_id,
+            f"Response from {self.name}: I received your query",
+            "response",
+            message.context_id
+        )
 
 async def main():
     # Create the registry and context manager
@@ -55,13 +71,7 @@ async def main():
     context = await context_manager.create_context()
     
     # Entity A sends a message to Entity B
-    message = Message(
-        sender_id=entity_a.id,
-        recipient_id=entity_b.id,
-        content="Hello from Entity A!",
-        intent="query",
-        context_id=context.id
-    )
+    message = _make(entity_a.id, entity_b.id, "Hello from Entity A!", "query", context.id)
     
     # Process the message through the registry
     response = await registry.route_message(message)
@@ -77,4 +87,5 @@ async def main():
         print(f"From {msg.sender_id} to {msg.recipient_id}: {msg.content}")
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -5,7 +5,7 @@ ReGenNexus Core - Setup Script
 This script installs the ReGenNexus Core Universal Agent Protocol.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 import os
 
 # Read requirements
@@ -16,6 +16,15 @@ with open('requirements.txt') as f:
 with open('README.md', encoding='utf-8') as f:
     long_description = f.read()
 
+# Optional Cython build of hot-path modules (pure-Python by default)
+ext_modules = []
+if os.environ.get('REGENNEXUS_ENABLE_SPEEDUPS') == '1':
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("bridges.ros_bridge", ["src/bridges/ros_bridge.py"])],
+        language_level=3,
+    )
+
 setup(
     name="regennexus-core",
     version="0.1.1",
@@ -27,6 +36,7 @@ setup(
     url="https://github.com/ReGenNow/ReGenNexus",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -41,21 +51,34 @@ setup(
     extras_require={
         "raspberry_pi": [
             "RPi.GPIO>=0.7.0",
+            "pigpio>=1.78",
             "picamera>=1.13"
         ],
         "jetson": [
             "jetson-stats>=3.1.0",
-            "Jetson.GPIO>=2.0.17"
+            "Jetson.GPIO>=2.0.17",
+            "PyTurboJPEG>=1.7.0"
         ],
         "ros": [
-            "rclpy>=1.0.0"
+            "rclpy>=1.0.0",
+            "numpy>=1.21.0"
+        ],
+        "iot": [
+            "orjson>=3.6.0",
+            "uvloop>=0.19; platform_system!='Windows'"
         ],
         "azure": [
-            "azure-iot-device>=2.12.0"
+            "azure-iot-device>=2.12.0",
+            # MQTT transport used by azure-iot-device; keep within its supported range
+            "paho-mqtt>=1.6.1,<2.0; platform_system!='Emscripten'",
+            "orjson>=3.6.0",
+            "ijson>=3.1",
+            "uvloop>=0.19; platform_system!='Windows'"
         ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.18.0",
+            "cython>=3.0.0",
             "black>=22.3.0",
             "isort>=5.10.0",
             "mypy>=0.950",
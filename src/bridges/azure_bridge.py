@@ -6,17 +6,80 @@ enabling communication with Azure IoT Hub and related services.
 """
 
 import asyncio
+import io
 import json
 import base64
 import hmac
 import hashlib
 import urllib.parse
 import logging
+import re
 import time
 from typing import Dict, List, Optional, Any, Callable
 
+try:
+    # Optional accelerated JSON codec; falls back to the standard library
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional streaming JSON parser for extracting selected top-level keys
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Pre-bound callables used on the message and token hot paths
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads  # accepts UTF-8 bytes directly
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+_b64decode = base64.b64decode
+_b64encode = base64.b64encode
+_quote = urllib.parse.quote
+_time = time.time
+_hmac_new = hmac.new
+_sha256 = hashlib.sha256
+
+# Key=Value pairs of an Azure connection string; values may contain '='
+_CS_RE = re.compile(r'([^=;]+)=([^;]*)')
+
+
+def _extract_json_keys(data: bytes, keys: frozenset) -> Dict[str, Any]:
+    """
+    Extract selected top-level keys from a JSON object payload.
+    
+    Uses a streaming parser when available so the rest of the document is
+    never materialized; parsing stops once every requested key is found.
+    
+    Args:
+        data: UTF-8 encoded JSON object
+        keys: Top-level keys to extract
+        
+    Returns:
+        Dictionary containing the requested keys present in the payload
+    """
+    if ijson is None:
+        obj = _json_loads(data)
+        return {k: obj[k] for k in keys if k in obj}
+    
+    result = {}
+    for key, value in ijson.kvitems(io.BytesIO(data), '', use_float=True):
+        if key in keys:
+            result[key] = value
+            if len(result) == len(keys):
+                break
+    return result
+
+
 class AzureBridge:
     """
     Bridge between ReGenNexus Core and Azure IoT services.
@@ -24,17 +87,29 @@ class AzureBridge:
     Provides connectivity to Azure IoT Hub and related services.
     """
     
-    def __init__(self, connection_string: Optional[str] = None):
+    def __init__(self, connection_string: Optional[str] = None,
+                 twin_debounce: float = 0.05):
         """
         Initialize the Azure bridge.
         
         Args:
             connection_string: Azure IoT Hub connection string
+            twin_debounce: Seconds to coalesce device twin updates before patching
         """
         self.connection_string = connection_string
+        self.twin_debounce = twin_debounce
         self.device_mappings = {}
         self.azure_initialized = False
         self.client = None
+        self._message_type = None
+        self._inbound = None
+        self._consumer = None
+        self._loop = None
+        self._pending_twin_updates = {}
+        self._twin_flush_event = None
+        self._twin_flusher = None
+        self._sas_key = None
+        self._hmac_template = None
         
     async def initialize(self):
         """Initialize the Azure bridge."""
@@ -46,6 +121,7 @@ class AzureBridge:
             # Try to import Azure IoT SDK
             # Note: This is done at runtime to avoid hard dependency on Azure
             import azure.iot.device
+            from azure.iot.device import Message
             from azure.iot.device.aio import IoTHubDeviceClient
             
             # Parse connection string
@@ -54,11 +130,18 @@ class AzureBridge:
             # Create client
             self.client = IoTHubDeviceClient.create_from_connection_string(self.connection_string)
             await self.client.connect()
+            self._message_type = Message
             
-            # Set up message handlers
-            self.client.on_message_received = lambda message: asyncio.create_task(
-                self._handle_cloud_to_device_message(message)
-            )
+            # Set up message handlers; inbound messages are processed by a
+            # single consumer task draining a bounded queue
+            self._loop = asyncio.get_running_loop()
+            self._inbound = asyncio.Queue(maxsize=1024)
+            self._consumer = asyncio.create_task(self._inbound_loop())
+            self.client.on_message_received = self._on_message_received
+            
+            # Reported property updates are coalesced by a background flusher
+            self._twin_flush_event = asyncio.Event()
+            self._twin_flusher = asyncio.create_task(self._twin_flush_loop())
             
             self.azure_initialized = True
             logger.info(f"Azure IoT Hub bridge initialized for host: {cs_args.get('HostName')}")
@@ -75,6 +158,23 @@ class AzureBridge:
         if not self.azure_initialized or not self.client:
             return
         
+        if self._twin_flusher:
+            self._twin_flusher.cancel()
+            try:
+                await self._twin_flusher
+            except asyncio.CancelledError:
+                pass
+            self._twin_flusher = None
+            await self._flush_twin_updates()
+        
+        if self._consumer:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+        
         try:
             await self.client.disconnect()
             logger.info("Azure IoT Hub bridge shut down")
@@ -92,17 +192,12 @@ class AzureBridge:
         Returns:
             Dictionary of connection string components
         """
-        result = {}
-        parts = connection_string.split(';')
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                result[key] = value
-        return result
+        return {m.group(1): m.group(2) for m in _CS_RE.finditer(connection_string)}
     
     async def map_device_to_entity(self, device_id: str, entity_id: str,
                                  device_to_entity_transform: Optional[Callable] = None,
-                                 entity_to_device_transform: Optional[Callable] = None):
+                                 entity_to_device_transform: Optional[Callable] = None,
+                                 extract_keys: Optional[List[str]] = None):
         """
         Map an Azure IoT device to a ReGenNexus entity.
         
@@ -111,6 +206,9 @@ class AzureBridge:
             entity_id: ReGenNexus entity ID
             device_to_entity_transform: Function to transform device messages to entity messages
             entity_to_device_transform: Function to transform entity messages to device messages
+            extract_keys: Optional top-level keys to extract from cloud-to-device
+                messages. When set, payloads must be JSON objects and only these
+                keys are parsed and passed on; other fields are skipped.
         """
         if not self.azure_initialized:
             logger.warning("Azure bridge not initialized. Cannot map device.")
@@ -119,11 +217,45 @@ class AzureBridge:
         self.device_mappings[device_id] = {
             "entity_id": entity_id,
             "device_to_entity_transform": device_to_entity_transform,
-            "entity_to_device_transform": entity_to_device_transform
+            "entity_to_device_transform": entity_to_device_transform,
+            "extract_keys": frozenset(extract_keys) if extract_keys else None
         }
         
         logger.info(f"Mapped Azure IoT device {device_id} to entity {entity_id}")
     
+    def _on_message_received(self, message):
+        """
+        Azure SDK callback for cloud-to-device messages.
+        
+        The SDK may invoke handlers from a worker thread, so the message is
+        handed over to the event loop before being queued.
+        
+        Args:
+            message: Azure IoT Hub message
+        """
+        self._loop.call_soon_threadsafe(self._enqueue_inbound, message)
+    
+    def _enqueue_inbound(self, message):
+        """
+        Queue an inbound message for the consumer task.
+        
+        Args:
+            message: Azure IoT Hub message
+        """
+        try:
+            self._inbound.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Inbound Azure message queue full, dropping message")
+    
+    async def _inbound_loop(self):
+        """Process queued cloud-to-device messages one at a time."""
+        while True:
+            message = await self._inbound.get()
+            try:
+                await self._handle_cloud_to_device_message(message)
+            except Exception as e:
+                logger.error(f"Error handling cloud-to-device message: {e}")
+    
     async def _handle_cloud_to_device_message(self, message):
         """
         Handle a message received from Azure IoT Hub.
@@ -142,8 +274,11 @@ class AzureBridge:
         
         # Parse message content
         try:
-            content = message.data.decode('utf-8')
-            data = json.loads(content)
+            extract_keys = mapping.get("extract_keys")
+            if extract_keys:
+                data = _extract_json_keys(message.data, extract_keys)
+            else:
+                data = _json_loads(message.data)
         except Exception as e:
             logger.error(f"Failed to parse message content: {e}")
             return
@@ -188,12 +323,12 @@ class AzureBridge:
         else:
             device_msg = message
         
-        # Convert message to JSON
-        msg_json = json.dumps(device_msg)
+        # Convert message to JSON bytes
+        msg_bytes = _json_dumps(device_msg)
         
         # Send the message
         try:
-            await self.client.send_message(msg_json)
+            await self.client.send_message(self._message_type(msg_bytes))
             logger.debug(f"Sent message to Azure IoT Hub for device {device_id}")
         except Exception as e:
             logger.error(f"Failed to send message to Azure IoT Hub: {e}")
@@ -202,6 +337,9 @@ class AzureBridge:
         """
         Update device twin reported properties.
         
+        Updates are merged per device and sent as a single patch
+        ``twin_debounce`` seconds after the first pending update.
+        
         Args:
             device_id: Azure IoT device ID
             properties: Properties to update
@@ -214,11 +352,30 @@ class AzureBridge:
             logger.warning(f"Unknown device ID: {device_id}")
             return
         
-        try:
-            await self.client.patch_twin_reported_properties(properties)
-            logger.debug(f"Updated device twin for device {device_id}")
-        except Exception as e:
-            logger.error(f"Failed to update device twin: {e}")
+        pending = self._pending_twin_updates.get(device_id)
+        if pending is None:
+            self._pending_twin_updates[device_id] = dict(properties)
+        else:
+            pending.update(properties)
+        self._twin_flush_event.set()
+    
+    async def _twin_flush_loop(self):
+        """Send coalesced device twin updates after the debounce window."""
+        while True:
+            await self._twin_flush_event.wait()
+            self._twin_flush_event.clear()
+            await asyncio.sleep(self.twin_debounce)
+            await self._flush_twin_updates()
+    
+    async def _flush_twin_updates(self):
+        """Send all pending device twin updates, one patch per device."""
+        pending, self._pending_twin_updates = self._pending_twin_updates, {}
+        for device_id, properties in pending.items():
+            try:
+                await self.client.patch_twin_reported_properties(properties)
+                logger.debug(f"Updated device twin for device {device_id}")
+            except Exception as e:
+                logger.error(f"Failed to update device twin: {e}")
     
     async def get_device_twin(self, device_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -280,23 +437,24 @@ class AzureBridge:
             SAS token
         """
         if not expiry:
-            expiry = int(time.time() + 3600)  # Default to 1 hour
+            expiry = int(_time() + 3600)  # Default to 1 hour
         
-        encoded_uri = urllib.parse.quote(uri, safe='')
+        encoded_uri = _quote(uri, safe='')
         ttl = int(expiry)
         sign_key = f"{encoded_uri}\n{ttl}"
         
-        key = base64.b64decode(key)
-        signature = hmac.HMAC(key, sign_key.encode('utf-8'), hashlib.sha256).digest()
-        signature = base64.b64encode(signature).decode('utf-8')
+        # Reuse the keyed HMAC state; rebuilt only when the key changes
+        if key != self._sas_key:
+            self._hmac_template = _hmac_new(_b64decode(key), None, _sha256)
+            self._sas_key = key
+        h = self._hmac_template.copy()
+        h.update(sign_key.encode('utf-8'))
+        signature = _b64encode(h.digest()).decode('utf-8')
         
-        token = {
-            'sr': uri,
-            'sig': signature,
-            'se': str(ttl)
-        }
+        # sr is already quoted and se is all digits, so only sig/skn need quoting
+        token = f"sr={encoded_uri}&sig={_quote(signature, safe='')}&se={ttl}"
         
         if policy_name:
-            token['skn'] = policy_name
+            token += f"&skn={_quote(policy_name, safe='')}"
         
-        return 'SharedAccessSignature ' + '&'.join([f"{k}={urllib.parse.quote(v, safe='')}" for k, v in token.items()])
+        return 'SharedAccessSignature ' + token
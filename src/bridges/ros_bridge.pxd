@@ -0,0 +1,30 @@
+# Cython declarations for ros_bridge.py (pure-Python mode).
+# Only used when building with REGENNEXUS_ENABLE_SPEEDUPS=1; see setup.py.
+
+cdef class ROSBridge:
+    cdef public str node_name
+    cdef public object executor_cls
+    cdef public double wake_period_s
+    cdef public dict topic_mappings
+    cdef public dict service_mappings
+    cdef public dict action_mappings
+    cdef public dict parameter_mappings
+    cdef public bint ros_initialized
+    cdef public dict subscribers
+    cdef public dict publishers
+    cdef public dict service_clients
+    cdef public dict service_servers
+    cdef public dict action_clients
+    cdef public dict action_servers
+    cdef public object node
+    cdef public object executor
+    cdef public object executor_thread
+    cdef public dict _to_dict_cache
+    cdef public dict _from_dict_cache
+    cdef public object _loop
+    cdef public object _cb_group
+    cdef public dict _drainers
+    cdef public dict _pub_fastpath
+
+    cpdef dict _ros_msg_to_dict(self, object ros_msg)
+    cpdef object _dict_to_ros_msg(self, object data, object ros_msg)
@@ -5,13 +5,284 @@ This module implements a bridge between ReGenNexus Core and ROS 2,
 enabling seamless communication between ROS topics/services and ReGenNexus entities.
 """
 
+import array
 import asyncio
+import importlib
 import json
 import logging
+import struct
+import sys
+from collections import deque
 from typing import Dict, List, Optional, Any, Callable
 
+try:
+    # Optional: used to stack batched numeric fields into arrays
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Field kinds used by the per-type message converters
+_PLAIN = 0
+_NESTED = 1
+_NESTED_SEQUENCE = 2
+_BUFFER = 3
+
+# Element types of array fields exposed as zero-copy buffers
+_BUFFER_ELEMENT_TYPES = frozenset((
+    'byte', 'octet', 'char', 'int8', 'uint8', 'int16', 'uint16',
+    'int32', 'uint32', 'int64', 'uint64', 'float', 'double',
+    'float32', 'float64',
+))
+
+def _array_element_type(field_type: str) -> Optional[str]:
+    """
+    Get the element type of an array or sequence field type.
+    
+    Args:
+        field_type: rosidl field type, e.g. "sequence<uint8>" or "double[9]"
+        
+    Returns:
+        The element type, or None if the field is not an array
+    """
+    if field_type.startswith('sequence<'):
+        return field_type[9:-1].split(',')[0].strip()
+    if field_type.endswith(']'):
+        return field_type[:field_type.index('[')]
+    return None
+
+def _as_buffer(value: Any) -> Any:
+    """
+    Wrap an array field value in a memoryview without copying.
+    
+    Args:
+        value: Field value (array.array, bytes or NumPy array)
+        
+    Returns:
+        A memoryview over the value, or the value itself if it does not
+        support the buffer protocol
+    """
+    try:
+        return memoryview(value)
+    except TypeError:
+        return value
+
+def _message_fields(msg_cls) -> List[tuple]:
+    """
+    Classify the fields of a ROS message class.
+    
+    Uses the rosidl-generated ``get_fields_and_field_types()`` when available
+    and falls back to inspecting ``__slots__`` on a default instance.
+    
+    Args:
+        msg_cls: ROS message class
+        
+    Returns:
+        List of (field_name, kind) tuples
+    """
+    fields = []
+    get_fields = getattr(msg_cls, 'get_fields_and_field_types', None)
+    if get_fields is not None:
+        for field_name, field_type in get_fields().items():
+            if _array_element_type(field_type) in _BUFFER_ELEMENT_TYPES:
+                kind = _BUFFER
+            elif '/' not in field_type:
+                kind = _PLAIN
+            elif field_type.startswith('sequence<') or field_type.endswith(']'):
+                kind = _NESTED_SEQUENCE
+            else:
+                kind = _NESTED
+            fields.append((field_name, kind))
+        return fields
+    
+    default = msg_cls()
+    for slot in getattr(msg_cls, '__slots__', ()):
+        field_name = slot.lstrip('_')
+        value = getattr(default, field_name, None)
+        fields.append((field_name, _NESTED if hasattr(value, '__slots__') else _PLAIN))
+    return fields
+
+# struct codes of CDR primitive types, keyed by rosidl type name
+_CDR_PRIMITIVES = {
+    'boolean': '?', 'bool': '?', 'byte': 'B', 'octet': 'B', 'char': 'B',
+    'int8': 'b', 'uint8': 'B', 'int16': 'h', 'uint16': 'H',
+    'int32': 'i', 'uint32': 'I', 'int64': 'q', 'uint64': 'Q',
+    'float': 'f', 'float32': 'f', 'double': 'd', 'float64': 'd',
+}
+
+# Parsers for raw CDR messages keyed by (message class, little endian)
+_cdr_parser_cache: Dict[tuple, Optional[Callable]] = {}
+
+def _cdr_field_readers(msg_cls, endian: str) -> Optional[List[Callable]]:
+    """
+    Build CDR field readers for a ROS message class.
+    
+    Each reader takes (buffer, offset, result_dict), stores one field and
+    returns the offset following it. Offsets are relative to the end of the
+    4-byte encapsulation header, which is what CDR alignment is based on.
+    
+    Args:
+        msg_cls: ROS message class
+        endian: struct byte order prefix ('<' or '>')
+        
+    Returns:
+        List of readers, or None if the schema contains unsupported types
+        (wide strings or sequences of nested messages)
+    """
+    get_fields = getattr(msg_cls, 'get_fields_and_field_types', None)
+    if get_fields is None:
+        return None
+    
+    native = (endian == '<') == (sys.byteorder == 'little')
+    uint32 = struct.Struct(endian + 'I')
+    readers = []
+    default = None
+    
+    for field_name, field_type in get_fields().items():
+        element_type = _array_element_type(field_type)
+        
+        if field_type in _CDR_PRIMITIVES:
+            def read(buf, off, out, name=field_name, st=struct.Struct(endian + _CDR_PRIMITIVES[field_type])):
+                size = st.size
+                off = (off + size - 1) & -size
+                out[name] = st.unpack_from(buf, off)[0]
+                return off + size
+        
+        elif field_type == 'string' or field_type.startswith('string<='):
+            def read(buf, off, out, name=field_name):
+                off = (off + 3) & -4
+                length = uint32.unpack_from(buf, off)[0]
+                off += 4
+                out[name] = str(buf[off:off + length - 1], 'utf-8') if length else ''
+                return off + length
+        
+        elif element_type in _CDR_PRIMITIVES:
+            code = _CDR_PRIMITIVES[element_type]
+            size = struct.calcsize(code)
+            count = None if field_type.startswith('sequence<') else int(field_type[field_type.index('[') + 1:-1])
+            
+            def read(buf, off, out, name=field_name, code=code, size=size, count=count):
+                n = count
+                if n is None:
+                    off = (off + 3) & -4
+                    n = uint32.unpack_from(buf, off)[0]
+                    off += 4
+                if n:
+                    off = (off + size - 1) & -size
+                end = off + n * size
+                # Zero-copy view when the data's byte order matches ours
+                if native or size == 1:
+                    out[name] = buf[off:end].cast(code)
+                else:
+                    out[name] = list(struct.unpack_from(f"{endian}{n}{code}", buf, off))
+                return end
+        
+        elif '/' in field_type and element_type is None:
+            if default is None:
+                default = msg_cls()
+            nested_readers = _cdr_field_readers(type(getattr(default, field_name)), endian)
+            if nested_readers is None:
+                return None
+            
+            def read(buf, off, out, name=field_name, nested_readers=nested_readers):
+                nested = {}
+                for nested_read in nested_readers:
+                    off = nested_read(buf, off, nested)
+                out[name] = nested
+                return off
+        
+        else:
+            return None
+        
+        readers.append(read)
+    
+    return readers
+
+def _build_cdr_parser(msg_cls, little_endian: bool = True) -> Optional[Callable]:
+    """
+    Get a parser turning raw CDR message bytes directly into a dictionary.
+    
+    Args:
+        msg_cls: ROS message class
+        little_endian: Byte order of the serialized data
+        
+    Returns:
+        Function taking the serialized message bytes and returning a
+        dictionary, or None if the message schema is not supported
+    """
+    key = (msg_cls, little_endian)
+    if key in _cdr_parser_cache:
+        return _cdr_parser_cache[key]
+    
+    readers = _cdr_field_readers(msg_cls, '<' if little_endian else '>')
+    parser = None
+    if readers is not None:
+        def parser(data: bytes) -> Dict[str, Any]:
+            # Skip the 4-byte encapsulation header
+            buf = memoryview(data)[4:]
+            result = {}
+            off = 0
+            for read in readers:
+                off = read(buf, off, result)
+            return result
+    
+    _cdr_parser_cache[key] = parser
+    return parser
+
+def _stack_field(values: List[Any]) -> Any:
+    """
+    Combine one field's values across a batch of messages.
+    
+    Args:
+        values: Field values, one per message
+        
+    Returns:
+        A NumPy array when the values are numeric and NumPy is available,
+        otherwise the list of values
+    """
+    first = values[0]
+    if np is None:
+        return values
+    
+    if isinstance(first, (int, float)) and not isinstance(first, bool):
+        return np.asarray(values)
+    
+    if isinstance(first, (bytes, bytearray)):
+        arrays = [np.frombuffer(v, dtype=np.uint8) for v in values]
+    elif isinstance(first, (array.array, np.ndarray, memoryview)):
+        arrays = [np.asarray(v) for v in values]
+    else:
+        return values
+    
+    if all(a.shape == arrays[0].shape for a in arrays):
+        return np.stack(arrays)
+    return arrays
+
+def _make_loop_drained_group():
+    """
+    Create a callback group whose entities the rclpy executor skips.
+    
+    The executor only waits on entities whose group can execute them, so
+    subscriptions in this group are taken solely from the event loop.
+    
+    Returns:
+        The callback group
+    """
+    from rclpy.callback_groups import CallbackGroup
+    
+    class LoopDrainedCallbackGroup(CallbackGroup):
+        def can_execute(self, entity):
+            return False
+        
+        def beginning_execution(self, entity):
+            return False
+        
+        def ending_execution(self, entity):
+            pass
+    
+    return LoopDrainedCallbackGroup()
+
 class ROSBridge:
     """
     Bridge between ReGenNexus Core and ROS 2.
@@ -20,14 +291,37 @@ class ROSBridge:
     ReGenNexus entities.
     """
     
-    def __init__(self, node_name: str = "regennexus_bridge"):
+    __slots__ = (
+        "node_name", "executor_cls", "wake_period_s",
+        "topic_mappings", "service_mappings", "action_mappings", "parameter_mappings",
+        "ros_initialized", "subscribers", "publishers",
+        "service_clients", "service_servers", "action_clients", "action_servers",
+        "node", "executor", "executor_thread",
+        "_to_dict_cache", "_from_dict_cache", "_loop", "_cb_group", "_loop_group",
+        "_drainers", "_pub_fastpath",
+    )
+    
+    # Resolved ROS interface types keyed by (kind, "package/Type")
+    _msg_type_cache = {}
+    
+    def __init__(self, node_name: str = "regennexus_bridge",
+                 executor_cls: Optional[type] = None,
+                 wake_period_s: float = 0.010):
         """
         Initialize the ROS bridge.
         
         Args:
             node_name: Name of the ROS node
+            executor_cls: Optional rclpy executor class. Defaults to
+                SingleThreadedExecutor, since bridge callbacks only hand
+                messages over to the asyncio loop.
+            wake_period_s: Maximum time the executor waits for work in one spin
+                iteration. Lower values reduce worst-case latency at the cost
+                of more idle CPU.
         """
         self.node_name = node_name
+        self.executor_cls = executor_cls
+        self.wake_period_s = wake_period_s
         self.topic_mappings = {}
         self.service_mappings = {}
         self.action_mappings = {}
@@ -39,9 +333,24 @@ class ROSBridge:
         self.service_servers = {}
         self.action_clients = {}
         self.action_servers = {}
+        # Messages parsed from raw CDR already arrive as dictionaries
+        self._to_dict_cache: Dict[type, Callable] = {dict: lambda msg: msg}
+        self._from_dict_cache: Dict[type, Dict[str, Callable]] = {}
+        self._loop = None
+        self._cb_group = None
+        self._loop_group = None
+        self._drainers = {}
+        self._pub_fastpath = {}
         
     async def initialize(self):
-        """Initialize the ROS bridge."""
+        """
+        Initialize the ROS bridge.
+        
+        Must be awaited from the event loop that will handle ROS messages;
+        callbacks from the ROS executor thread are dispatched onto that loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        
         try:
             # Import ROS 2 Python client library
             # Note: This is done at runtime to avoid hard dependency on ROS
@@ -51,12 +360,22 @@ class ROSBridge:
             # Initialize ROS 2
             rclpy.init()
             self.node = Node(self.node_name)
-            self.executor = rclpy.executors.MultiThreadedExecutor()
+            
+            # Bridge subscriptions only hand messages to the event loop, so they
+            # share a reentrant group rather than the node's default mutually
+            # exclusive group
+            from rclpy.callback_groups import ReentrantCallbackGroup
+            self._cb_group = ReentrantCallbackGroup()
+            # Subscriptions drained from the event loop are kept away from
+            # the executor so that only one thread takes their messages
+            self._loop_group = _make_loop_drained_group()
+            executor_cls = self.executor_cls or rclpy.executors.SingleThreadedExecutor
+            self.executor = executor_cls()
             self.executor.add_node(self.node)
             
             # Start the executor in a separate thread
             import threading
-            self.executor_thread = threading.Thread(target=self.executor.spin, daemon=True)
+            self.executor_thread = threading.Thread(target=self._spin, daemon=True)
             self.executor_thread.start()
             
             self.ros_initialized = True
@@ -69,6 +388,13 @@ class ROSBridge:
             logger.error(f"Failed to initialize ROS 2 bridge: {e}")
             self.ros_initialized = False
     
+    def _spin(self):
+        """Run the ROS executor with a bounded wait per iteration."""
+        import rclpy
+        
+        while rclpy.ok():
+            self.executor.spin_once(timeout_sec=self.wake_period_s)
+    
     async def shutdown(self):
         """Shut down the ROS bridge."""
         if not self.ros_initialized:
@@ -77,6 +403,16 @@ class ROSBridge:
         try:
             import rclpy
             
+            # Stop queue drainers and pending batch flushes
+            for drainer in self._drainers.values():
+                drainer.cancel()
+            self._drainers.clear()
+            
+            for mapping in self.topic_mappings.values():
+                if mapping.get("batch_handle") is not None:
+                    mapping["batch_handle"].cancel()
+                    mapping["batch_handle"] = None
+            
             # Clean up subscribers and publishers
             for topic, sub in self.subscribers.items():
                 self.node.destroy_subscription(sub)
@@ -111,7 +447,10 @@ class ROSBridge:
                                 direction: str = "bidirectional",
                                 message_type: str = "std_msgs/String",
                                 topic_to_entity_transform: Optional[Callable] = None,
-                                entity_to_topic_transform: Optional[Callable] = None):
+                                entity_to_topic_transform: Optional[Callable] = None,
+                                batch_window: Optional[float] = None,
+                                max_batch: int = 100,
+                                queue_size: int = 100):
         """
         Map a ROS topic to a ReGenNexus entity.
         
@@ -122,17 +461,56 @@ class ROSBridge:
             message_type: ROS message type
             topic_to_entity_transform: Function to transform ROS messages to entity messages
             entity_to_topic_transform: Function to transform entity messages to ROS messages
+            batch_window: Optional window in seconds over which incoming messages are
+                coalesced and forwarded as a single batch (see _batch_to_entity_msg)
+            max_batch: Number of buffered messages that triggers an early batch flush
+            queue_size: Maximum number of received messages waiting to be handled;
+                the oldest messages are dropped when it is exceeded
         """
         if not self.ros_initialized:
             logger.warning("ROS bridge not initialized. Cannot map topic.")
             return
         
+        # Rebuilt below if the new mapping still publishes to the topic
+        self._pub_fastpath.pop(topic_name, None)
+        
+        # A running drainer keeps waiting on the topic's wake event, so a
+        # remap carries the event and any queued messages over
+        previous = self.topic_mappings.get(topic_name)
+        if previous is not None:
+            queue = previous["queue"]
+            if queue.maxlen != queue_size:
+                queue = deque(queue, maxlen=queue_size)
+            wake = previous["wake"]
+            wake_pending = previous["wake_pending"]
+            
+            # Whether the subscription takes raw CDR depends on the transform,
+            # so subscribe again when a transform is added or removed
+            subscriber = self.subscribers.get(topic_name)
+            if (subscriber is not None and
+                    bool(previous["topic_to_entity_transform"]) != bool(topic_to_entity_transform)):
+                self.node.destroy_subscription(subscriber)
+                del self.subscribers[topic_name]
+                # Queued messages were decoded for the old subscription
+                queue.clear()
+        else:
+            queue = deque(maxlen=queue_size)
+            wake = asyncio.Event()
+            wake_pending = False
+        
         self.topic_mappings[topic_name] = {
             "entity_id": entity_id,
             "direction": direction,
             "message_type": message_type,
             "topic_to_entity_transform": topic_to_entity_transform,
-            "entity_to_topic_transform": entity_to_topic_transform
+            "entity_to_topic_transform": entity_to_topic_transform,
+            "batch_window": batch_window,
+            "max_batch": max_batch,
+            "batch_buf": [],
+            "batch_handle": None,
+            "queue": queue,
+            "wake": wake,
+            "wake_pending": wake_pending
         }
         
         # Set up ROS subscriber if needed
@@ -142,9 +520,37 @@ class ROSBridge:
         # Set up ROS publisher if needed
         if direction in ["to_topic", "bidirectional"]:
             await self._create_publisher(topic_name, message_type)
+            
+            # Pre-resolve everything publish_to_ros needs into one lookup
+            publisher = self.publishers.get(topic_name)
+            if publisher is not None:
+                self._pub_fastpath[topic_name] = (
+                    publisher,
+                    entity_to_topic_transform,
+                    self._build_from_dict(publisher.msg_type)
+                )
         
         logger.info(f"Mapped ROS topic {topic_name} to entity {entity_id} ({direction})")
     
+    def _resolve_type(self, spec: str, kind: str) -> type:
+        """
+        Resolve a ROS interface type from its "package/Type" name.
+        
+        Args:
+            spec: Interface name, e.g. "std_msgs/String"
+            kind: Interface kind ("msg", "srv" or "action")
+            
+        Returns:
+            The ROS interface class
+        """
+        key = (kind, spec)
+        resolved = self._msg_type_cache.get(key)
+        if resolved is None:
+            module_name, class_name = spec.split('/')
+            resolved = getattr(importlib.import_module(f"{module_name}.{kind}"), class_name)
+            self._msg_type_cache[key] = resolved
+        return resolved
+    
     async def _create_subscriber(self, topic_name: str, message_type: str):
         """
         Create a ROS subscriber for a topic.
@@ -157,24 +563,149 @@ class ROSBridge:
             return
         
         try:
-            # Import ROS message type dynamically
-            msg_module, msg_class = message_type.split('/')
-            exec(f"from {msg_module}.msg import {msg_class}")
-            msg_type = eval(f"{msg_class}")
+            msg_type = self._resolve_type(message_type, "msg")
+            
+            # Without a custom transform the message is only flattened to a
+            # dictionary, so take the serialized CDR bytes and parse them
+            # directly when the schema allows, skipping the Python message object
+            parse_raw = None
+            mapping = self.topic_mappings.get(topic_name, {})
+            if not mapping.get("topic_to_entity_transform"):
+                parse_raw = self._make_raw_parser(msg_type)
             
-            # Create subscriber
+            if parse_raw:
+                callback = lambda data, topic=topic_name: self._enqueue_ros_message(topic, parse_raw(data))
+            else:
+                callback = lambda msg, topic=topic_name: self._enqueue_ros_message(topic, msg)
+            
+            # Create subscriber; it starts out hidden from the executor
             self.subscribers[topic_name] = self.node.create_subscription(
                 msg_type,
                 topic_name,
-                lambda msg: asyncio.run(self._handle_ros_message(topic_name, msg)),
-                10  # QoS profile depth
+                callback,
+                10,  # QoS profile depth
+                callback_group=self._loop_group,
+                raw=parse_raw is not None
             )
             
+            # Where rclpy exposes the rmw "new message" hook, drain the
+            # subscription directly from the event loop as soon as data arrives
+            # instead of waiting for the executor to collect it. Otherwise hand
+            # the subscription to the executor. Either way messages are taken
+            # by one thread only, so they are queued in the order received.
+            subscription = self.subscribers[topic_name]
+            handle = getattr(subscription, 'handle', None)
+            if hasattr(handle, 'set_on_new_message_callback'):
+                handle.set_on_new_message_callback(
+                    lambda count, topic=topic_name, sub=subscription: self._loop.call_soon_threadsafe(
+                        self._drain_subscription, topic, sub, parse_raw
+                    )
+                )
+            else:
+                subscription.callback_group = self._cb_group
+                self._cb_group.add_entity(subscription)
+            
+            # Received messages are handled by one drainer task per topic,
+            # which outlives the subscription when it is re-created
+            if topic_name not in self._drainers:
+                self._drainers[topic_name] = self._loop.create_task(self._drain_topic_queue(topic_name))
+            
             logger.debug(f"Created ROS subscriber for topic: {topic_name}")
             
         except Exception as e:
             logger.error(f"Failed to create ROS subscriber for topic {topic_name}: {e}")
     
+    def _enqueue_ros_message(self, topic_name: str, msg):
+        """
+        Queue a received message for its topic's drainer task.
+        
+        Called from the ROS executor thread, or from the event loop for
+        subscriptions drained there. The deque append is atomic, and the
+        event loop is only woken if the drainer is not already scheduled.
+        
+        Args:
+            topic_name: Name of the ROS topic
+            msg: ROS message, or dictionary parsed from raw CDR
+        """
+        mapping = self.topic_mappings.get(topic_name)
+        if mapping is None:
+            return
+        
+        mapping["queue"].append(msg)
+        if not mapping["wake_pending"]:
+            mapping["wake_pending"] = True
+            self._loop.call_soon_threadsafe(mapping["wake"].set)
+    
+    async def _drain_topic_queue(self, topic_name: str):
+        """
+        Handle queued messages for a topic as they arrive.
+        
+        Args:
+            topic_name: Name of the ROS topic
+        """
+        wake = self.topic_mappings[topic_name]["wake"]
+        while True:
+            await wake.wait()
+            wake.clear()
+            # Look the queue up on every pass as the topic may be remapped
+            # while a message is being handled
+            self.topic_mappings[topic_name]["wake_pending"] = False
+            while self.topic_mappings[topic_name]["queue"]:
+                try:
+                    msg = self.topic_mappings[topic_name]["queue"].popleft()
+                    await self._handle_ros_message(topic_name, msg)
+                except Exception as e:
+                    logger.error(f"Error handling message from ROS topic {topic_name}: {e}")
+    
+    def _make_raw_parser(self, msg_type) -> Optional[Callable]:
+        """
+        Build a parser for serialized (raw CDR) messages of a type.
+        
+        Args:
+            msg_type: ROS message class
+            
+        Returns:
+            Function converting serialized message bytes to a dictionary,
+            or None if the message schema is not supported
+        """
+        parse_le = _build_cdr_parser(msg_type, little_endian=True)
+        parse_be = _build_cdr_parser(msg_type, little_endian=False)
+        if parse_le is None or parse_be is None:
+            return None
+        
+        def parse(data: bytes) -> Dict[str, Any]:
+            # The second encapsulation byte is 1 for little-endian CDR
+            return parse_le(data) if data[1] & 1 else parse_be(data)
+        
+        return parse
+    
+    def _drain_subscription(self, topic_name: str, subscription,
+                            parse_raw: Optional[Callable] = None):
+        """
+        Take all pending messages from a subscription and dispatch them.
+        
+        Runs on the event loop in response to the rmw "new message" hook.
+        The executor does not wait on such subscriptions, so this is the only
+        path that takes their messages and they are queued in the order the
+        middleware delivered them.
+        
+        Args:
+            topic_name: Name of the ROS topic
+            subscription: rclpy subscription
+            parse_raw: Parser for serialized messages, if the subscription is raw
+        """
+        while True:
+            try:
+                with subscription.handle:
+                    taken = subscription.handle.take_message(subscription.msg_type, subscription.raw)
+            except Exception as e:
+                logger.error(f"Failed to take message from ROS topic {topic_name}: {e}")
+                return
+            
+            if taken is None:
+                return
+            self._enqueue_ros_message(topic_name, parse_raw(taken[0]) if parse_raw else taken[0])
+    
     async def _create_publisher(self, topic_name: str, message_type: str):
         """
         Create a ROS publisher for a topic.
@@ -187,10 +718,7 @@ class ROSBridge:
             return
         
         try:
-            # Import ROS message type dynamically
-            msg_module, msg_class = message_type.split('/')
-            exec(f"from {msg_module}.msg import {msg_class}")
-            msg_type = eval(f"{msg_class}")
+            msg_type = self._resolve_type(message_type, "msg")
             
             # Create publisher
             self.publishers[topic_name] = self.node.create_publisher(
@@ -216,7 +744,19 @@ class ROSBridge:
             return
         
         mapping = self.topic_mappings[topic_name]
-        entity_id = mapping["entity_id"]
+        
+        # Buffer the message if batching is enabled for this topic
+        if mapping.get("batch_window"):
+            buf = mapping["batch_buf"]
+            buf.append(ros_msg)
+            if len(buf) >= mapping["max_batch"]:
+                await self._flush_batch(topic_name)
+            elif mapping["batch_handle"] is None:
+                mapping["batch_handle"] = self._loop.call_later(
+                    mapping["batch_window"],
+                    lambda: self._loop.create_task(self._flush_batch(topic_name))
+                )
+            return
         
         # Transform the message if a transform function is provided
         transform_func = mapping.get("topic_to_entity_transform")
@@ -226,10 +766,69 @@ class ROSBridge:
             # Default transformation: convert ROS message to dictionary
             entity_msg = self._ros_msg_to_dict(ros_msg)
         
-        # Forward the message to the entity
+        await self._forward_to_entity(topic_name, mapping["entity_id"], entity_msg)
+    
+    async def _flush_batch(self, topic_name: str):
+        """
+        Forward the messages buffered for a topic as one batch.
+        
+        Args:
+            topic_name: Name of the ROS topic
+        """
+        mapping = self.topic_mappings.get(topic_name)
+        if not mapping:
+            return
+        
+        if mapping["batch_handle"] is not None:
+            mapping["batch_handle"].cancel()
+            mapping["batch_handle"] = None
+        
+        batch = mapping["batch_buf"]
+        if not batch:
+            return
+        mapping["batch_buf"] = []
+        
+        entity_msg = self._batch_to_entity_msg(batch, mapping.get("topic_to_entity_transform"))
+        await self._forward_to_entity(topic_name, mapping["entity_id"], entity_msg)
+    
+    def _batch_to_entity_msg(self, batch: List[Any], transform_func: Optional[Callable]) -> Dict[str, Any]:
+        """
+        Convert a batch of ROS messages into a single entity message.
+        
+        Without a transform, fields are laid out column-wise: each field maps to
+        the list of its values across the batch. When NumPy is available, numeric
+        scalar fields become 1-D arrays and equally sized byte/numeric array
+        fields are stacked into a single 2-D array.
+        
+        Args:
+            batch: Buffered ROS messages, oldest first
+            transform_func: Optional per-message transform function
+            
+        Returns:
+            Batched entity message
+        """
+        if transform_func:
+            return {"count": len(batch), "messages": [transform_func(msg) for msg in batch]}
+        
+        dicts = [self._ros_msg_to_dict(msg) for msg in batch]
+        result = {"count": len(batch)}
+        for field_name in dicts[0]:
+            result[field_name] = _stack_field([d[field_name] for d in dicts])
+        return result
+    
+    async def _forward_to_entity(self, topic_name: str, entity_id: str, entity_msg: Any):
+        """
+        Forward a converted ROS message to its mapped entity.
+        
+        Args:
+            topic_name: Name of the ROS topic
+            entity_id: Identifier of the ReGenNexus entity
+            entity_msg: Converted message
+        """
         # This would typically be done through the ReGenNexus Core protocol
         # For now, we just log it
-        logger.info(f"Forwarding message from ROS topic {topic_name} to entity {entity_id}: {entity_msg}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Forwarding message from ROS topic %s to entity %s: %r", topic_name, entity_id, entity_msg)
         
         # In a real implementation, you would send the message to the entity
         # await protocol.send_message(entity_id, entity_msg, intent="ros_message")
@@ -242,24 +841,17 @@ class ROSBridge:
             topic_name: Name of the ROS topic
             message: Message to publish
         """
-        if not self.ros_initialized or topic_name not in self.publishers:
+        fastpath = self._pub_fastpath.get(topic_name)
+        if not self.ros_initialized or fastpath is None:
             logger.warning(f"Cannot publish to ROS topic {topic_name}: topic not mapped or bridge not initialized")
             return
         
-        mapping = self.topic_mappings[topic_name]
-        
-        # Transform the message if a transform function is provided
-        transform_func = mapping.get("entity_to_topic_transform")
-        if transform_func:
-            ros_msg = transform_func(message)
-        else:
-            # Default transformation: convert dictionary to ROS message
-            msg_type = self.publishers[topic_name].msg_type
-            ros_msg = self._dict_to_ros_msg(message, msg_type)
+        publisher, transform_func, build = fastpath
         
-        # Publish the message
-        self.publishers[topic_name].publish(ros_msg)
-        logger.debug(f"Published message to ROS topic {topic_name}")
+        # Transform the message if a transform function is provided,
+        # otherwise convert the dictionary to a ROS message
+        publisher.publish(transform_func(message) if transform_func else build(message))
+        logger.debug("Published message to ROS topic %s", topic_name)
     
     async def map_service_to_entity(self, service_name: str, entity_id: str,
                                   service_type: str,
@@ -303,16 +895,15 @@ class ROSBridge:
             return
         
         try:
-            # Import ROS service type dynamically
-            srv_module, srv_class = service_type.split('/')
-            exec(f"from {srv_module}.srv import {srv_class}")
-            srv_type = eval(f"{srv_class}")
+            srv_type = self._resolve_type(service_type, "srv")
             
             # Create service server
             self.service_servers[service_name] = self.node.create_service(
                 srv_type,
                 service_name,
-                lambda request, response: asyncio.run(self._handle_ros_service_request(service_name, request, response))
+                lambda request, response, service=service_name: asyncio.run_coroutine_threadsafe(
+                    self._handle_ros_service_request(service, request, response), self._loop
+                ).result()
             )
             
             logger.debug(f"Created ROS service server for service: {service_name}")
@@ -346,7 +937,9 @@ class ROSBridge:
         # Forward the request to the entity
         # This would typically be done through the ReGenNexus Core protocol
         # For now, we just log it and return a dummy response
-        logger.info(f"Forwarding service request from ROS service {service_name} to entity {entity_id}: {entity_msg}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Forwarding service request from ROS service %s to entity %s: %r",
+                        service_name, entity_id, entity_msg)
         
         # In a real implementation, you would send the request to the entity and wait for a response
         # entity_response = await protocol.send_request(entity_id, entity_msg, intent="ros_service_request")
@@ -374,28 +967,86 @@ class ROSBridge:
         Returns:
             Dictionary representation of the message
         """
-        result = {}
+        converter = self._to_dict_cache.get(type(ros_msg))
+        if converter is None:
+            converter = self._build_to_dict(type(ros_msg))
+        return converter(ros_msg)
+    
+    def _build_to_dict(self, msg_cls) -> Callable:
+        """
+        Build and cache a dictionary converter for a ROS message class.
         
-        # Get all fields in the message
-        for field_name in dir(ros_msg):
-            # Skip private and special fields
-            if field_name.startswith('_'):
-                continue
+        Args:
+            msg_cls: ROS message class
             
-            # Skip methods and callables
-            if callable(getattr(ros_msg, field_name)):
-                continue
+        Returns:
+            Function converting instances of msg_cls to dictionaries
+        """
+        fields = _message_fields(msg_cls)
+        plain = tuple(name for name, kind in fields if kind == _PLAIN)
+        nested = tuple(name for name, kind in fields if kind == _NESTED)
+        nested_sequences = tuple(name for name, kind in fields if kind == _NESTED_SEQUENCE)
+        buffers = tuple(name for name, kind in fields if kind == _BUFFER)
+        to_dict = self._ros_msg_to_dict
+        
+        def convert(ros_msg) -> Dict[str, Any]:
+            result = {name: getattr(ros_msg, name) for name in plain}
+            # Bulk numeric arrays are exposed as views, not copied
+            for name in buffers:
+                result[name] = _as_buffer(getattr(ros_msg, name))
+            for name in nested:
+                result[name] = to_dict(getattr(ros_msg, name))
+            for name in nested_sequences:
+                result[name] = [to_dict(item) for item in getattr(ros_msg, name)]
+            return result
+        
+        self._to_dict_cache[msg_cls] = convert
+        return convert
+    
+    def _build_from_dict(self, msg_cls) -> Callable:
+        """
+        Build a function creating ROS messages of a class from dictionaries.
+        
+        Args:
+            msg_cls: ROS message class
+            
+        Returns:
+            Function taking a dictionary and returning a new msg_cls instance
+        """
+        dict_to_msg = self._dict_to_ros_msg
+        return lambda data: dict_to_msg(data, msg_cls())
+    
+    def _build_setters(self, msg_cls) -> Dict[str, Callable]:
+        """
+        Build and cache per-field setters for a ROS message class.
+        
+        Whether a field is nested is decided here once, so copying a
+        dictionary into a message needs no per-field type checks.
+        
+        Args:
+            msg_cls: ROS message class
             
-            # Get the field value
-            value = getattr(ros_msg, field_name)
+        Returns:
+            Dictionary mapping field names to setter(ros_msg, value) functions
+        """
+        dict_to_msg = self._dict_to_ros_msg
+        setters = {}
+        for field_name, kind in _message_fields(msg_cls):
+            if kind == _NESTED:
+                setters[field_name] = lambda ros_msg, value, name=field_name: dict_to_msg(
+                    value, getattr(ros_msg, name)
+                )
+                continue
             
-            # Handle nested messages
-            if hasattr(value, '__slots__'):
-                result[field_name] = self._ros_msg_to_dict(value)
+            # Call the generated property setter directly where there is one
+            fset = getattr(getattr(msg_cls, field_name, None), 'fset', None)
+            if fset is not None:
+                setters[field_name] = fset
             else:
-                result[field_name] = value
+                setters[field_name] = lambda ros_msg, value, name=field_name: setattr(ros_msg, name, value)
         
-        return result
+        self._from_dict_cache[msg_cls] = setters
+        return setters
     
     def _dict_to_ros_msg(self, data: Dict[str, Any], ros_msg):
         """
@@ -405,14 +1056,13 @@ class ROSBridge:
             data: Source dictionary
             ros_msg: Target ROS message
         """
+        setters = self._from_dict_cache.get(type(ros_msg))
+        if setters is None:
+            setters = self._build_setters(type(ros_msg))
+        
         for field_name, value in data.items():
-            if hasattr(ros_msg, field_name):
-                field = getattr(ros_msg, field_name)
-                
-                # Handle nested messages
-                if hasattr(field, '__slots__'):
-                    self._dict_to_ros_msg(value, field)
-                else:
-                    setattr(ros_msg, field_name, value)
+            setter = setters.get(field_name)
+            if setter is not None:
+                setter(ros_msg, value)
         
         return ros_msg
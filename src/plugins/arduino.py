@@ -6,14 +6,26 @@ It supports serial communication and pin control.
 """
 
 import asyncio
+import itertools
 import logging
 import json
 import os
 import time
+from collections import deque
 import serial
 import serial.tools.list_ports
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Callable, Union
 
+try:
+    # Optional accelerated JSON decoder; falls back to the standard library
+    import orjson
+    _json_loads = orjson.loads  # accepts any bytes-like object
+except ImportError:
+    def _json_loads(data: Union[bytes, memoryview]) -> Any:
+        """Decode a UTF-8 JSON document from a bytes-like object."""
+        return json.loads(bytes(data))
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -22,11 +34,23 @@ logger = logging.getLogger(__name__)
 # Import base plugin class
 from .base import DevicePlugin
 
+# Pre-encoded command frame fragments
+_CMD_DIGITAL_READ = b"DR "
+_CMD_DIGITAL_WRITE = b"DW "
+_CMD_DIGITAL_WRITE_BATCH = b"DWB "
+_CMD_ANALOG_READ = b"AR "
+_CMD_ANALOG_WRITE = b"AW "
+_LEVEL_HIGH = b" 1"
+_LEVEL_LOW = b" 0"
+_NEWLINE = b"\n"
+
 class ArduinoPlugin(DevicePlugin):
     """Arduino plugin for ReGenNexus Core."""
     
     def __init__(self, entity_id: str, port: Optional[str] = None, 
-                 baud_rate: int = 9600, protocol=None):
+                 baud_rate: int = 9600, protocol=None,
+                 pipeline_commands: bool = False,
+                 batch_digital_writes: bool = False):
         """
         Initialize the Arduino plugin.
         
@@ -35,6 +59,12 @@ class ArduinoPlugin(DevicePlugin):
             port: Serial port (e.g., '/dev/ttyACM0', 'COM3')
             baud_rate: Serial baud rate
             protocol: Optional protocol instance for message handling
+            pipeline_commands: Allow multiple commands in flight. Each command is
+                sent as "<id> <command>" and the sketch must echo the id in its
+                JSON response (e.g. {"id": 7, "response": "DR", "value": 1})
+            batch_digital_writes: Coalesce digital writes issued in the same
+                event loop iteration into one "DWB <pin> <level> ..." frame,
+                which the sketch must answer with a single response
         """
         super().__init__(entity_id, 'arduino', protocol)
         self.port = port
@@ -42,8 +72,27 @@ class ArduinoPlugin(DevicePlugin):
         self.serial = None
         self.connected = False
         self.read_task = None
-        self.command_queue = asyncio.Queue()
-        self.response_queue = asyncio.Queue()
+        # (command verb, future) of unpipelined commands awaiting a response,
+        # oldest first; a done future marks a command that timed out
+        self._waiters: deque = deque()
+        # Blocking serial I/O runs on dedicated threads, one per direction
+        self._rx_exec = None
+        self._tx_exec = None
+        # Received bytes not yet split into lines; on POSIX the event loop
+        # watches the serial descriptor and fills it as data arrives
+        self._rx_buf = bytearray()
+        self._rx_ready = None
+        self._rx_fd = None
+        # Resolved when the sketch reports {"event": "ready"} after a reset
+        self._boot_ready = None
+        # Outstanding pipelined commands keyed by request ID
+        self.pipeline_commands = pipeline_commands
+        self._next_id = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Digital writes waiting to be sent as one batch frame
+        self.batch_digital_writes = batch_digital_writes
+        self._write_batch: List[tuple] = []
+        self._batch_tasks: set = set()
     
     async def initialize(self) -> bool:
         """
@@ -76,12 +125,33 @@ class ArduinoPlugin(DevicePlugin):
                 # Connect to Arduino
                 try:
                     self.serial = serial.Serial(self.port, self.baud_rate, timeout=1)
-                    await asyncio.sleep(2)  # Wait for Arduino to reset
-                    self.connected = True
+                    
+                    # Pulse DTR so the board resets now rather than at some
+                    # point during the first exchange; virtual ports may not
+                    # support modem control lines
+                    try:
+                        self.serial.dtr = False
+                        await asyncio.sleep(0.05)
+                        self.serial.dtr = True
+                    except OSError as e:
+                        logger.debug("Could not toggle DTR on %s: %s", self.port, e)
                     
                     # Start read task
+                    self._boot_ready = asyncio.get_running_loop().create_future()
+                    self._rx_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arduino-rx')
+                    self._tx_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='arduino-tx')
+                    self._rx_ready = asyncio.Event()
+                    self._watch_serial_fd()
                     self.read_task = asyncio.create_task(self._read_serial())
                     
+                    # Wait for Arduino to reset; sketches that do not report
+                    # readiness get the full reset time
+                    try:
+                        await asyncio.wait_for(self._boot_ready, timeout=2.0)
+                    except asyncio.TimeoutError:
+                        logger.debug("No ready event from Arduino, assuming reset is complete")
+                    self.connected = True
+                    
                     logger.info(f"Connected to Arduino on {self.port}")
                     self.metadata.update({
                         'status': 'connected',
@@ -97,13 +167,13 @@ class ArduinoPlugin(DevicePlugin):
                     })
             
             # Add capabilities
-            self.capabilities.extend([
+            self.capabilities.update((
                 'arduino.digital_read',
                 'arduino.digital_write',
                 'arduino.analog_read',
                 'arduino.analog_write',
                 'arduino.send_command'
-            ])
+            ))
             
             # Register command handlers
             self.register_command_handler('arduino.digital_read', self._handle_digital_read)
@@ -140,11 +210,19 @@ class ArduinoPlugin(DevicePlugin):
                 self.read_task = None
             
             # Close serial connection
+            self._unwatch_serial_fd()
             if self.serial:
                 self.serial.close()
                 self.serial = None
                 self.connected = False
             
+            # Release serial I/O threads; a pending read ends at its timeout
+            for executor in (self._rx_exec, self._tx_exec):
+                if executor:
+                    executor.shutdown(wait=False)
+            self._rx_exec = None
+            self._tx_exec = None
+            
             # Shut down base plugin
             await super().shutdown()
             
@@ -157,34 +235,49 @@ class ArduinoPlugin(DevicePlugin):
     
     async def _read_serial(self) -> None:
         """Read data from the serial port."""
+        loop = asyncio.get_running_loop()
         try:
             while True:
-                if self.serial and self.serial.in_waiting:
+                if self._rx_fd is not None:
+                    # Woken by _on_serial_ready once new bytes are buffered
+                    await self._rx_ready.wait()
+                    self._rx_ready.clear()
+                else:
+                    # Block in the RX thread until data arrives or the serial
+                    # timeout expires, then take whatever else is buffered
                     try:
-                        line = self.serial.readline().decode('utf-8').strip()
-                        if line:
-                            logger.debug(f"Received from Arduino: {line}")
-                            
-                            # Try to parse as JSON
-                            try:
-                                data = json.loads(line)
-                                
-                                # Check if it's a response to a command
-                                if 'response' in data:
-                                    await self.response_queue.put(data)
-                                
-                                # Check if it's an event
-                                elif 'event' in data:
-                                    await self.emit_event('arduino', data)
-                            except json.JSONDecodeError:
-                                # Not JSON, treat as plain text
-                                await self.emit_event('arduino.data', {
-                                    'data': line
-                                })
+                        chunk = await loop.run_in_executor(self._rx_exec, self._blocking_read)
+                    except asyncio.CancelledError:
+                        raise
                     except Exception as e:
                         logger.error(f"Error reading from Arduino: {e}")
+                        await asyncio.sleep(0.1)
+                        continue
+                    
+                    if not chunk:
+                        continue
+                    self._rx_buf += chunk
+                
+                # Move every complete line out of the buffer in one copy, so
+                # the reader can keep appending while lines are processed,
+                # and hand each line on as a view into that block
+                last = self._rx_buf.rfind(b'\n')
+                if last < 0:
+                    continue
+                block = self._rx_buf[:last]
+                del self._rx_buf[:last + 1]
                 
-                await asyncio.sleep(0.01)
+                view = memoryview(block)
+                start = 0
+                while start <= last:
+                    end = block.find(b'\n', start)
+                    if end < 0:
+                        end = last
+                    try:
+                        await self._process_line(view[start:end])
+                    except Exception as e:
+                        logger.error(f"Error reading from Arduino: {e}")
+                    start = end + 1
                 
         except asyncio.CancelledError:
             # Task was cancelled, exit
@@ -193,12 +286,139 @@ class ArduinoPlugin(DevicePlugin):
         except Exception as e:
             logger.error(f"Error in serial read task: {e}")
     
-    async def _send_command(self, command: str) -> Optional[Dict[str, Any]]:
+    def _watch_serial_fd(self) -> bool:
+        """
+        Register the serial port descriptor with the event loop.
+        
+        Returns:
+            Boolean indicating whether reads are event driven; if not, the
+            read task falls back to blocking reads on the RX thread
+        """
+        try:
+            fd = self.serial.fileno()
+            asyncio.get_running_loop().add_reader(fd, self._on_serial_ready)
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            # Windows ports and the proactor loop cannot watch the descriptor
+            return False
+        
+        self._rx_fd = fd
+        return True
+    
+    def _unwatch_serial_fd(self) -> None:
+        """Stop watching the serial port descriptor."""
+        if self._rx_fd is not None:
+            asyncio.get_running_loop().remove_reader(self._rx_fd)
+            self._rx_fd = None
+    
+    def _on_serial_ready(self) -> None:
+        """Drain readable serial data into the receive buffer (event loop callback)."""
+        try:
+            waiting = self.serial.in_waiting
+            self._rx_buf += self.serial.read(waiting or 1)
+        except Exception as e:
+            # Typically a disconnect; stop the descriptor from firing
+            # continuously and let the RX thread path handle retries
+            logger.error(f"Error reading from Arduino: {e}")
+            self._unwatch_serial_fd()
+        self._rx_ready.set()
+    
+    def _blocking_read(self) -> bytes:
+        """
+        Read available data from the serial port (runs on the RX thread).
+        
+        Returns:
+            Received bytes, empty if the serial timeout expired
+        """
+        data = self.serial.read(1)
+        if data:
+            waiting = self.serial.in_waiting
+            if waiting:
+                data += self.serial.read(waiting)
+        return data
+    
+    async def _process_line(self, line: Union[bytes, memoryview]) -> None:
+        """
+        Process a line received from the Arduino.
+        
+        Args:
+            line: Raw received line without the newline; may still carry
+                surrounding whitespace such as a trailing carriage return
+        """
+        if not line:
+            return
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received from Arduino: %r", bytes(line))
+        
+        # Try to parse as JSON straight from the raw bytes
+        try:
+            data = _json_loads(line)
+            
+            # Check if it's a response to a command
+            if 'response' in data:
+                if self.pipeline_commands:
+                    # Senders remove their entry as soon as they stop waiting,
+                    # so late or unknown IDs simply miss here
+                    future = self._pending.pop(data.get('id'), None)
+                    if future is not None:
+                        future.set_result(data)
+                else:
+                    self._match_waiter(data)
+            
+            # Check if it's an event
+            elif 'event' in data:
+                if data['event'] == 'ready' and self._boot_ready and not self._boot_ready.done():
+                    self._boot_ready.set_result(True)
+                await self.emit_event('arduino', data)
+        except ValueError:
+            # Not JSON, treat as plain text
+            text = str(line, 'utf-8').strip()
+            if text:
+                await self.emit_event('arduino.data', {
+                    'data': text
+                })
+    
+    def _match_waiter(self, data: Dict[str, Any]) -> None:
+        """
+        Hand an unpipelined response to the command it answers.
+        
+        Responses carry no ID, so they are matched in send order and checked
+        against the command verb they echo. A late response to a timed-out
+        command is discarded with its entry, and a timed-out entry whose
+        response never came is dropped once a later command is answered.
+        
+        Args:
+            data: Parsed response
+        """
+        verb = str(data['response'])
+        while self._waiters:
+            command_verb, future = self._waiters[0]
+            if command_verb == verb:
+                self._waiters.popleft()
+                if not future.done():
+                    future.set_result(data)
+                return
+            if not future.done():
+                # Not a response to the oldest live command
+                logger.warning(f"Discarding unexpected response from Arduino: {verb}")
+                return
+            self._waiters.popleft()
+    
+    def _blocking_write(self, data: bytes) -> None:
+        """
+        Write data to the serial port (runs on the TX thread).
+        
+        Args:
+            data: Bytes to write
+        """
+        self.serial.write(data)
+    
+    async def _send_command(self, command: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Send a command to the Arduino and wait for response.
         
         Args:
-            command: Command string to send
+            command: Command to send, without the line terminator
             
         Returns:
             Response data or None if error
@@ -207,17 +427,46 @@ class ArduinoPlugin(DevicePlugin):
             if not self.connected or not self.serial:
                 raise ValueError("Not connected to Arduino")
             
-            # Send command
-            self.serial.write(f"{command}\n".encode('utf-8'))
-            self.serial.flush()
+            loop = asyncio.get_running_loop()
+            if isinstance(command, str):
+                command = command.encode('utf-8')
             
-            # Wait for response
+            if self.pipeline_commands:
+                # Tag the command so its response can be matched by ID
+                command_id = next(self._next_id)
+                future = loop.create_future()
+                self._pending[command_id] = future
+                try:
+                    await loop.run_in_executor(
+                        self._tx_exec, self._blocking_write, b"%d %s\n" % (command_id, command)
+                    )
+                    return await asyncio.wait_for(future, timeout=5.0)
+                except asyncio.TimeoutError:
+                    logger.error(f"Timeout waiting for response to command: {command.decode('utf-8', 'replace')}")
+                    return None
+                finally:
+                    self._pending.pop(command_id, None)
+            
+            # Responses carry no ID, so they resolve waiters in send order
+            future = loop.create_future()
+            waiter = (command.split(None, 1)[0].decode('utf-8', 'replace'), future)
+            self._waiters.append(waiter)
+            sent = False
             try:
-                response = await asyncio.wait_for(self.response_queue.get(), timeout=5.0)
-                return response
+                await loop.run_in_executor(
+                    self._tx_exec, self._blocking_write, command + _NEWLINE
+                )
+                sent = True
+                return await asyncio.wait_for(future, timeout=5.0)
             except asyncio.TimeoutError:
-                logger.error(f"Timeout waiting for response to command: {command}")
+                logger.error(f"Timeout waiting for response to command: {command.decode('utf-8', 'replace')}")
                 return None
+            finally:
+                if not future.done():
+                    future.cancel()
+                if not sent:
+                    # No response will come for a command that was never written
+                    self._waiters.remove(waiter)
             
         except Exception as e:
             logger.error(f"Error sending command to Arduino: {e}")
@@ -233,44 +482,36 @@ class ArduinoPlugin(DevicePlugin):
         Returns:
             Pin state
         """
-        try:
-            # Check if connected
-            if not self.connected:
-                return {
-                    'success': False,
-                    'error': "Not connected to Arduino"
-                }
-            
-            # Get pin number
-            pin = params.get('pin')
-            if pin is None:
-                return {
-                    'success': False,
-                    'error': "Missing pin parameter"
-                }
-            
-            # Send command to Arduino
-            command = f"DR {pin}"
-            response = await self._send_command(command)
-            
-            if not response:
-                return {
-                    'success': False,
-                    'error': "No response from Arduino"
-                }
-            
+        # Check if connected
+        if not self.connected:
             return {
-                'success': True,
-                'pin': pin,
-                'value': response.get('value', 0)
+                'success': False,
+                'error': "Not connected to Arduino"
             }
-            
-        except Exception as e:
-            logger.error(f"Error handling digital read: {e}")
+        
+        # Get pin number
+        pin = params.get('pin')
+        if pin is None:
+            return {
+                'success': False,
+                'error': "Missing pin parameter"
+            }
+        
+        # Send command to Arduino
+        command = _CMD_DIGITAL_READ + str(pin).encode()
+        response = await self._send_command(command)
+        
+        if not response:
             return {
                 'success': False,
-                'error': str(e)
+                'error': "No response from Arduino"
             }
+        
+        return {
+            'success': True,
+            'pin': pin,
+            'value': response.get('value', 0)
+        }
     
     async def _handle_digital_write(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -282,45 +523,71 @@ class ArduinoPlugin(DevicePlugin):
         Returns:
             Command result
         """
-        try:
-            # Check if connected
-            if not self.connected:
-                return {
-                    'success': False,
-                    'error': "Not connected to Arduino"
-                }
-            
-            # Get parameters
-            pin = params.get('pin')
-            value = params.get('value')
-            if pin is None or value is None:
-                return {
-                    'success': False,
-                    'error': "Missing pin or value parameter"
-                }
-            
-            # Send command to Arduino
-            command = f"DW {pin} {1 if value else 0}"
-            response = await self._send_command(command)
-            
-            if not response:
-                return {
-                    'success': False,
-                    'error': "No response from Arduino"
-                }
-            
+        # Check if connected
+        if not self.connected:
             return {
-                'success': True,
-                'pin': pin,
-                'value': value
+                'success': False,
+                'error': "Not connected to Arduino"
             }
-            
-        except Exception as e:
-            logger.error(f"Error handling digital write: {e}")
+        
+        # Get parameters
+        pin = params.get('pin')
+        value = params.get('value')
+        if pin is None or value is None:
+            return {
+                'success': False,
+                'error': "Missing pin or value parameter"
+            }
+        
+        # Send command to Arduino
+        write = str(pin).encode() + (_LEVEL_HIGH if value else _LEVEL_LOW)
+        if self.batch_digital_writes:
+            response = await self._queue_digital_write(write)
+        else:
+            response = await self._send_command(_CMD_DIGITAL_WRITE + write)
+        
+        if not response:
             return {
                 'success': False,
-                'error': str(e)
+                'error': "No response from Arduino"
             }
+        
+        return {
+            'success': True,
+            'pin': pin,
+            'value': value
+        }
+    
+    async def _queue_digital_write(self, write: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Add a digital write to the pending batch and wait for the batch response.
+        
+        Args:
+            write: Encoded "<pin> <level>" pair
+            
+        Returns:
+            Response to the batch frame or None if error
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._write_batch.append((write, future))
+        if len(self._write_batch) == 1:
+            # Runs after the writes already scheduled in this iteration
+            task = asyncio.create_task(self._send_write_batch())
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+        return await future
+    
+    async def _send_write_batch(self) -> None:
+        """Send all queued digital writes as one frame and resolve their waiters."""
+        batch, self._write_batch = self._write_batch, []
+        response = None
+        try:
+            command = _CMD_DIGITAL_WRITE_BATCH + b" ".join(write for write, _ in batch)
+            response = await self._send_command(command)
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(response)
     
     async def _handle_analog_read(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -332,44 +599,36 @@ class ArduinoPlugin(DevicePlugin):
         Returns:
             Pin value
         """
-        try:
-            # Check if connected
-            if not self.connected:
-                return {
-                    'success': False,
-                    'error': "Not connected to Arduino"
-                }
-            
-            # Get pin number
-            pin = params.get('pin')
-            if pin is None:
-                return {
-                    'success': False,
-                    'error': "Missing pin parameter"
-                }
-            
-            # Send command to Arduino
-            command = f"AR {pin}"
-            response = await self._send_command(command)
-            
-            if not response:
-                return {
-                    'success': False,
-                    'error': "No response from Arduino"
-                }
-            
+        # Check if connected
+        if not self.connected:
             return {
-                'success': True,
-                'pin': pin,
-                'value': response.get('value', 0)
+                'success': False,
+                'error': "Not connected to Arduino"
             }
-            
-        except Exception as e:
-            logger.error(f"Error handling analog read: {e}")
+        
+        # Get pin number
+        pin = params.get('pin')
+        if pin is None:
+            return {
+                'success': False,
+                'error': "Missing pin parameter"
+            }
+        
+        # Send command to Arduino
+        command = _CMD_ANALOG_READ + str(pin).encode()
+        response = await self._send_command(command)
+        
+        if not response:
             return {
                 'success': False,
-                'error': str(e)
+                'error': "No response from Arduino"
             }
+        
+        return {
+            'success': True,
+            'pin': pin,
+            'value': response.get('value', 0)
+        }
     
     async def _handle_analog_write(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -381,48 +640,40 @@ class ArduinoPlugin(DevicePlugin):
         Returns:
             Command result
         """
-        try:
-            # Check if connected
-            if not self.connected:
-                return {
-                    'success': False,
-                    'error': "Not connected to Arduino"
-                }
-            
-            # Get parameters
-            pin = params.get('pin')
-            value = params.get('value')
-            if pin is None or value is None:
-                return {
-                    'success': False,
-                    'error': "Missing pin or value parameter"
-                }
-            
-            # Ensure value is in range 0-255
-            value = max(0, min(255, int(value)))
-            
-            # Send command to Arduino
-            command = f"AW {pin} {value}"
-            response = await self._send_command(command)
-            
-            if not response:
-                return {
-                    'success': False,
-                    'error': "No response from Arduino"
-                }
-            
+        # Check if connected
+        if not self.connected:
             return {
-                'success': True,
-                'pin': pin,
-                'value': value
+                'success': False,
+                'error': "Not connected to Arduino"
             }
-            
-        except Exception as e:
-            logger.error(f"Error handling analog write: {e}")
+        
+        # Get parameters
+        pin = params.get('pin')
+        value = params.get('value')
+        if pin is None or value is None:
+            return {
+                'success': False,
+                'error': "Missing pin or value parameter"
+            }
+        
+        # Ensure value is in range 0-255
+        value = max(0, min(255, int(value)))
+        
+        # Send command to Arduino
+        command = _CMD_ANALOG_WRITE + str(pin).encode() + b" %d" % value
+        response = await self._send_command(command)
+        
+        if not response:
             return {
                 'success': False,
-                'error': str(e)
+                'error': "No response from Arduino"
             }
+        
+        return {
+            'success': True,
+            'pin': pin,
+            'value': value
+        }
     
     async def _handle_send_command(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -434,40 +685,32 @@ class ArduinoPlugin(DevicePlugin):
         Returns:
             Command result
         """
-        try:
-            # Check if connected
-            if not self.connected:
-                return {
-                    'success': False,
-                    'error': "Not connected to Arduino"
-                }
-            
-            # Get command
-            command = params.get('command')
-            if not command:
-                return {
-                    'success': False,
-                    'error': "Missing command parameter"
-                }
-            
-            # Send command to Arduino
-            response = await self._send_command(command)
-            
-            if not response:
-                return {
-                    'success': False,
-                    'error': "No response from Arduino"
-                }
-            
+        # Check if connected
+        if not self.connected:
+            return {
+                'success': False,
+                'error': "Not connected to Arduino"
+            }
+        
+        # Get command
+        command = params.get('command')
+        if not command:
             return {
-                'success': True,
-                'command': command,
-                'response': response
+                'success': False,
+                'error': "Missing command parameter"
             }
-            
-        except Exception as e:
-            logger.error(f"Error handling send command: {e}")
+        
+        # Send command to Arduino
+        response = await self._send_command(command)
+        
+        if not response:
             return {
                 'success': False,
-                'error': str(e)
+                'error': "No response from Arduino"
             }
+        
+        return {
+            'success': True,
+            'command': command,
+            'response': response
+        }
@@ -6,15 +6,19 @@ All device plugins should inherit from this base class.
 """
 
 import asyncio
+import inspect
 import logging
 import json
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple, Union
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared stand-in for a missing message payload; never mutated
+_EMPTY: Dict[str, Any] = {}
+
 class DevicePlugin:
     """Base class for ReGenNexus device plugins."""
     
@@ -30,11 +34,23 @@ class DevicePlugin:
         self.entity_id = entity_id
         self.device_type = device_type
         self.protocol = protocol
+        # Recipients whose messages this plugin handles
+        self._accepted_recipients = frozenset((entity_id, '*'))
         self.initialized = False
-        self.capabilities = []
+        self.capabilities: Set[str] = set()
+        # Sorted capabilities for status responses; None when out of date
+        self._capability_snapshot: Optional[Tuple[str, ...]] = None
         self.metadata = {}
         self.command_handlers = {}
-        self.event_listeners = {}
+        # Listeners per event type, held as insertion-ordered dict keys
+        self.event_listeners: Dict[str, Dict[Callable, None]] = {}
+        # Broadcast intent strings keyed by event type
+        self._event_intent_cache: Dict[str, str] = {}
+        # Message intent -> handler taking (message, payload)
+        self._intent_dispatch: Dict[str, Callable] = {
+            'command': self._handle_command_intent,
+            'subscribe': self._handle_subscribe_intent
+        }
     
     async def initialize(self) -> bool:
         """
@@ -44,13 +60,14 @@ class DevicePlugin:
             Boolean indicating success
         """
         try:
-            # Register basic capabilities
-            self.capabilities = [
+            # Register basic capabilities alongside any added by subclasses
+            self.capabilities.update((
                 'device',
                 f'{self.device_type}',
                 'status',
                 'command'
-            ]
+            ))
+            self._capabilities_changed()
             
             # Set basic metadata
             self.metadata = {
@@ -72,7 +89,7 @@ class DevicePlugin:
                 await self.protocol.registry.register_entity(
                     entity_id=self.entity_id,
                     entity_type='device',
-                    capabilities=self.capabilities,
+                    capabilities=list(self._sorted_capabilities()),
                     metadata=self.metadata
                 )
             
@@ -121,12 +138,11 @@ class DevicePlugin:
             handler: Async function that takes command parameters and returns a result
         """
         self.command_handlers[command] = handler
-        logger.debug(f"Registered handler for command: {command}")
+        logger.debug("Registered handler for command: %s", command)
         
-        # Add to capabilities if not already present
-        capability = f'command.{command}'
-        if capability not in self.capabilities:
-            self.capabilities.append(capability)
+        # Add to capabilities
+        self.capabilities.add(f'command.{command}')
+        self._capabilities_changed()
     
     def unregister_command_handler(self, command: str) -> bool:
         """
@@ -140,12 +156,11 @@ class DevicePlugin:
         """
         if command in self.command_handlers:
             del self.command_handlers[command]
-            logger.debug(f"Unregistered handler for command: {command}")
+            logger.debug("Unregistered handler for command: %s", command)
             
             # Remove from capabilities
-            capability = f'command.{command}'
-            if capability in self.capabilities:
-                self.capabilities.remove(capability)
+            self.capabilities.discard(f'command.{command}')
+            self._capabilities_changed()
                 
             return True
         return False
@@ -158,16 +173,16 @@ class DevicePlugin:
             event_type: Event type
             listener: Async function that takes event data
         """
-        if event_type not in self.event_listeners:
-            self.event_listeners[event_type] = []
+        listeners = self.event_listeners.get(event_type)
+        if listeners is None:
+            listeners = self.event_listeners[event_type] = {}
             
-        self.event_listeners[event_type].append(listener)
-        logger.debug(f"Registered listener for event: {event_type}")
+        listeners[listener] = None
+        logger.debug("Registered listener for event: %s", event_type)
         
-        # Add to capabilities if not already present
-        capability = f'event.{event_type}'
-        if capability not in self.capabilities:
-            self.capabilities.append(capability)
+        # Add to capabilities
+        self.capabilities.add(f'event.{event_type}')
+        self._capabilities_changed()
     
     def unregister_event_listener(self, event_type: str, listener: Callable) -> bool:
         """
@@ -180,20 +195,40 @@ class DevicePlugin:
         Returns:
             Boolean indicating success
         """
-        if event_type in self.event_listeners and listener in self.event_listeners[event_type]:
-            self.event_listeners[event_type].remove(listener)
-            logger.debug(f"Unregistered listener for event: {event_type}")
+        listeners = self.event_listeners.get(event_type)
+        if listeners is not None and listener in listeners:
+            del listeners[listener]
+            logger.debug("Unregistered listener for event: %s", event_type)
             
             # Remove from capabilities if no more listeners
-            if not self.event_listeners[event_type]:
+            if not listeners:
                 del self.event_listeners[event_type]
-                capability = f'event.{event_type}'
-                if capability in self.capabilities:
-                    self.capabilities.remove(capability)
+                self.capabilities.discard(f'event.{event_type}')
+                self._capabilities_changed()
                     
             return True
         return False
     
+    def _capabilities_changed(self) -> None:
+        """Mark the cached capability snapshot as out of date."""
+        self._capability_snapshot = None
+    
+    def _sorted_capabilities(self) -> Tuple[str, ...]:
+        """
+        Get the plugin's capabilities in sorted order.
+        
+        The snapshot is rebuilt only after a capability change, so repeated
+        status polls do not re-sort the set. Code that modifies
+        ``capabilities`` directly must call ``_capabilities_changed``.
+        
+        Returns:
+            Sorted tuple of capability names
+        """
+        snapshot = self._capability_snapshot
+        if snapshot is None:
+            snapshot = self._capability_snapshot = tuple(sorted(self.capabilities))
+        return snapshot
+    
     async def emit_event(self, event_type: str, event_data: Dict[str, Any]) -> bool:
         """
         Emit an event to registered listeners and via protocol.
@@ -206,24 +241,34 @@ class DevicePlugin:
             Boolean indicating success
         """
         try:
-            # Call local listeners
-            if event_type in self.event_listeners:
-                for listener in self.event_listeners[event_type]:
-                    try:
-                        await listener(event_data)
-                    except Exception as e:
-                        logger.error(f"Error in event listener: {e}")
+            # Call local listeners concurrently; snapshot the list so
+            # listeners may (un)register while the event is in flight
+            pending = []
+            for listener in tuple(self.event_listeners.get(event_type, ())):
+                try:
+                    result = listener(event_data)
+                    if inspect.isawaitable(result):
+                        pending.append(result)
+                except Exception as e:
+                    logger.error(f"Error in event listener: {e}")
+            if pending:
+                for result in await asyncio.gather(*pending, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error in event listener: {result}")
             
             # Send event via protocol if available
             if self.protocol:
+                intent = self._event_intent_cache.get(event_type)
+                if intent is None:
+                    intent = self._event_intent_cache[event_type] = f'event.{event_type}'
                 await self.protocol.send_message(
                     sender=self.entity_id,
                     recipient='*',  # Broadcast
-                    intent=f'event.{event_type}',
+                    intent=intent,
                     payload=event_data
                 )
             
-            logger.debug(f"Emitted event: {event_type}")
+            logger.debug("Emitted event: %s", event_type)
             return True
             
         except Exception as e:
@@ -243,21 +288,21 @@ class DevicePlugin:
         """
         try:
             # Check if command is supported
-            if command not in self.command_handlers:
+            handler = self.command_handlers.get(command)
+            if handler is None:
                 return {
                     'success': False,
                     'error': f"Unsupported command: {command}"
                 }
             
             # Execute command
-            handler = self.command_handlers[command]
             result = await handler(params)
             
-            logger.debug(f"Executed command: {command}")
+            logger.debug("Executed command: %s", command)
             return result
             
         except Exception as e:
-            logger.error(f"Error executing command: {e}")
+            logger.error(f"Error executing command {command}: {e}")
             return {
                 'success': False,
                 'error': str(e)
@@ -272,57 +317,70 @@ class DevicePlugin:
         """
         try:
             # Check if message is for this entity
-            if message.get('recipient') != self.entity_id and message.get('recipient') != '*':
+            if message.get('recipient') not in self._accepted_recipients:
                 return
             
-            # Check intent
-            intent = message.get('intent', '')
-            
-            # Handle command intent
-            if intent == 'command':
-                # Extract command and parameters
-                command = message.get('payload', {}).get('command', '')
-                params = message.get('payload', {}).get('params', {})
-                
-                # Execute command
-                result = await self.execute_command(command, params)
-                
-                # Send response
-                if self.protocol and message.get('recipient') != '*':
-                    await self.protocol.send_message(
-                        sender=self.entity_id,
-                        recipient=message.get('sender'),
-                        intent='command_result',
-                        payload={
-                            'command': command,
-                            'result': result
-                        }
-                    )
-            
-            # Handle event subscription intent
-            elif intent == 'subscribe':
-                event_type = message.get('payload', {}).get('event_type', '')
-                if event_type:
-                    # Add capability if not already present
-                    capability = f'event.{event_type}'
-                    if capability not in self.capabilities:
-                        self.capabilities.append(capability)
-                    
-                    # Send acknowledgment
-                    if self.protocol and message.get('recipient') != '*':
-                        await self.protocol.send_message(
-                            sender=self.entity_id,
-                            recipient=message.get('sender'),
-                            intent='subscribe_ack',
-                            payload={
-                                'event_type': event_type,
-                                'success': True
-                            }
-                        )
+            # Dispatch on intent
+            handler = self._intent_dispatch.get(message.get('intent', ''))
+            if handler is not None:
+                await handler(message, message.get('payload') or _EMPTY)
             
         except Exception as e:
             logger.error(f"Error handling message: {e}")
     
+    async def _handle_command_intent(self, message: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """
+        Execute a command message and reply with its result.
+        
+        Args:
+            message: Command message
+            payload: Message payload
+        """
+        # Extract command and parameters
+        command = payload.get('command', '')
+        params = payload.get('params', {})
+        
+        # Execute command
+        result = await self.execute_command(command, params)
+        
+        # Send response
+        if self.protocol and message.get('recipient') != '*':
+            await self.protocol.send_message(
+                sender=self.entity_id,
+                recipient=message.get('sender'),
+                intent='command_result',
+                payload={
+                    'command': command,
+                    'result': result
+                }
+            )
+    
+    async def _handle_subscribe_intent(self, message: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        """
+        Record an event subscription and acknowledge it.
+        
+        Args:
+            message: Subscription message
+            payload: Message payload
+        """
+        event_type = payload.get('event_type', '')
+        if event_type:
+            # Add capability
+            self.capabilities.add(f'event.{event_type}')
+            self._capabilities_changed()
+            
+            # Send acknowledgment
+            if self.protocol and message.get('recipient') != '*':
+                await self.protocol.send_message(
+                    sender=self.entity_id,
+                    recipient=message.get('sender'),
+                    intent='subscribe_ack',
+                    payload={
+                        'event_type': event_type,
+                        'success': True
+                    }
+                )
+    
     async def _handle_status_command(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle status command.
@@ -338,7 +396,7 @@ class DevicePlugin:
             'status': self.metadata.get('status', 'unknown'),
             'device_type': self.device_type,
             'entity_id': self.entity_id,
-            'capabilities': self.capabilities,
+            'capabilities': self._sorted_capabilities(),
             'metadata': self.metadata
         }
     
@@ -354,5 +412,5 @@ class DevicePlugin:
         """
         return {
             'success': True,
-            'capabilities': self.capabilities
+            'capabilities': self._sorted_capabilities()
         }
@@ -6,13 +6,27 @@ It supports MQTT, HTTP, and other standard IoT protocols.
 """
 
 import asyncio
+import functools
+import inspect
 import logging
 import json
 import os
 import time
 import aiohttp
 import ssl
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, ClassVar, Tuple, Union
+
+try:
+    # Optional accelerated JSON codec; falls back to the standard library
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads  # accepts UTF-8 bytes directly
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, 
@@ -22,9 +36,264 @@ logger = logging.getLogger(__name__)
 # Import base plugin class
 from .base import DevicePlugin
 
+# HTTP session shared by all IoT plugin instances, closed with the last one
+_shared_http_session: Optional[aiohttp.ClientSession] = None
+_shared_http_users = 0
+
+
+def _acquire_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it on first use.
+    
+    Must be called from a running event loop.
+    
+    Returns:
+        Shared client session
+    """
+    global _shared_http_session, _shared_http_users
+    if _shared_http_session is None or _shared_http_session.closed:
+        # Keep DNS answers and idle connections around for bursty polling
+        connector = aiohttp.TCPConnector(
+            limit=1000,
+            limit_per_host=64,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=120,
+            enable_cleanup_closed=True
+        )
+        _shared_http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=5),
+            trust_env=False
+        )
+        _shared_http_users = 0
+    _shared_http_users += 1
+    return _shared_http_session
+
+
+async def _release_http_session() -> None:
+    """Release the shared HTTP session, closing it when no plugin uses it."""
+    global _shared_http_session, _shared_http_users
+    _shared_http_users -= 1
+    if _shared_http_users <= 0 and _shared_http_session is not None:
+        session, _shared_http_session = _shared_http_session, None
+        _shared_http_users = 0
+        await session.close()
+
+
+# TLS contexts for MQTT connections keyed by (cafile, verify)
+_tls_contexts: Dict[tuple, ssl.SSLContext] = {}
+
+
+def _get_tls_context(cafile: Optional[str] = None, verify: bool = True) -> ssl.SSLContext:
+    """
+    Get a client TLS context, loading CA certificates only once per configuration.
+    
+    Args:
+        cafile: Optional CA bundle to trust instead of the system store
+        verify: Whether to verify the broker certificate and hostname
+        
+    Returns:
+        Shared SSL context
+    """
+    key = (cafile, verify)
+    context = _tls_contexts.get(key)
+    if context is None:
+        context = ssl.create_default_context(cafile=cafile)
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        _tls_contexts[key] = context
+    return context
+
+
+# Streamed responses are read in bounded chunks with no overall deadline
+_STREAM_CHUNK_SIZE = 65536
+_STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=30)
+
+# Received MQTT messages waiting for handlers, per plugin; messages are
+# dropped rather than buffered without bound when handlers fall behind
+_DISPATCH_QUEUE_SIZE = 1024
+
+# First bytes a JSON document can start with; other payloads are plain text
+_JSON_START = frozenset(b'{["-0123456789tfn \t\r\n')
+
+
+class _TopicTrie:
+    """Trie of MQTT topic filters, keyed by topic level."""
+    
+    __slots__ = ('children', 'handlers')
+    
+    def __init__(self):
+        self.children: Dict[str, '_TopicTrie'] = {}
+        self.handlers: Optional[list] = None
+    
+    def insert(self, topic_filter: str, handlers: list) -> None:
+        """
+        Add a topic filter to the trie.
+        
+        Args:
+            topic_filter: Topic filter, which may contain '+' and '#' wildcards
+            handlers: Handler list to return for topics matching the filter
+        """
+        node = self
+        for level in topic_filter.split('/'):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TopicTrie()
+            node = child
+        node.handlers = handlers
+    
+    def match(self, topic: str) -> List[list]:
+        """
+        Find the filters matching a topic.
+        
+        Args:
+            topic: Topic name of a received message
+            
+        Returns:
+            Handler lists of all matching filters
+        """
+        levels = topic.split('/')
+        depth = len(levels)
+        # Wildcards do not match topics starting with '$' at the first level
+        wildcards = not topic.startswith('$')
+        matches = []
+        stack = [(self, 0)]
+        while stack:
+            node, i = stack.pop()
+            children = node.children
+            if wildcards or i:
+                # '#' also matches the parent level itself
+                multi = children.get('#')
+                if multi is not None and multi.handlers is not None:
+                    matches.append(multi.handlers)
+            if i == depth:
+                if node.handlers is not None:
+                    matches.append(node.handlers)
+                continue
+            child = children.get(levels[i])
+            if child is not None:
+                stack.append((child, i + 1))
+            if wildcards or i:
+                single = children.get('+')
+                if single is not None:
+                    stack.append((single, i + 1))
+        return matches
+
+
+# Broker connections shared by IoT plugins, keyed by connection settings
+_mqtt_pool: Dict[tuple, '_SharedMqttClient'] = {}
+
+
+class _SharedMqttClient:
+    """
+    MQTT broker connection shared by the IoT plugins connecting with the
+    same settings.
+    
+    Received messages and disconnects are fanned out to every plugin on the
+    event loop; each plugin only handles topics it subscribed to.
+    """
+    
+    __slots__ = ('key', 'client', 'client_id', 'loop', 'plugins', 'ready')
+    
+    def __init__(self, key: tuple, client: Any, client_id: str):
+        self.key = key
+        self.client = client
+        self.client_id = client_id
+        self.loop = asyncio.get_running_loop()
+        self.plugins: Tuple['IoTPlugin', ...] = ()
+        # Resolved once the broker connection is up
+        self.ready = self.loop.create_future()
+    
+    async def connect(self) -> None:
+        """Connect to the broker and take over the paho callbacks."""
+        try:
+            await self.client.connect()
+        except BaseException as e:
+            if _mqtt_pool.get(self.key) is self:
+                del _mqtt_pool[self.key]
+            self.ready.set_exception(e)
+            # Plugins waiting on the connection re-raise it themselves
+            self.ready.exception()
+            raise
+        
+        # Receive messages through paho's callbacks rather than a message
+        # generator; keep the client's own disconnect handling
+        paho_client = self.client._client
+        paho_client.on_message = self._on_message
+        on_disconnect = paho_client.on_disconnect
+        
+        def _on_disconnect(client, userdata, *args):
+            if on_disconnect:
+                on_disconnect(client, userdata, *args)
+            self.loop.call_soon_threadsafe(self._disconnected)
+        
+        paho_client.on_disconnect = _on_disconnect
+        self.ready.set_result(None)
+    
+    def _on_message(self, client, userdata, message) -> None:
+        """paho message callback; hands the message to the event loop."""
+        self.loop.call_soon_threadsafe(self._dispatch, message.topic, message.payload)
+    
+    def _dispatch(self, topic: str, payload: bytes) -> None:
+        """Deliver a received message to every plugin using the connection."""
+        for plugin in self.plugins:
+            plugin._dispatch_mqtt(topic, payload)
+    
+    def _disconnected(self) -> None:
+        """Drop the lost connection from the pool and notify its plugins."""
+        if _mqtt_pool.get(self.key) is self:
+            del _mqtt_pool[self.key]
+        for plugin in self.plugins:
+            plugin._on_mqtt_disconnected()
+
+
+async def _acquire_mqtt_client(key: tuple, factory: Callable[[], '_SharedMqttClient'],
+                               plugin: 'IoTPlugin') -> '_SharedMqttClient':
+    """
+    Get the pooled connection for a set of connection settings.
+    
+    Args:
+        key: Connection settings identifying the broker connection
+        factory: Creates the shared client when none is pooled yet
+        plugin: Plugin that will use the connection
+        
+    Returns:
+        Connected shared client
+    """
+    shared = _mqtt_pool.get(key)
+    if shared is None:
+        shared = _mqtt_pool[key] = factory()
+        await shared.connect()
+    else:
+        await asyncio.shield(shared.ready)
+    shared.plugins += (plugin,)
+    return shared
+
+
+async def _release_mqtt_client(shared: '_SharedMqttClient', plugin: 'IoTPlugin') -> None:
+    """Release a pooled connection, disconnecting when no plugin uses it."""
+    shared.plugins = tuple(p for p in shared.plugins if p is not plugin)
+    if not shared.plugins and _mqtt_pool.get(shared.key) is shared:
+        del _mqtt_pool[shared.key]
+        await shared.client.disconnect()
+
+
 class IoTPlugin(DevicePlugin):
     """IoT plugin for ReGenNexus Core."""
     
+    # Capability -> (handler method name, leading positional arguments)
+    _HANDLERS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'iot.mqtt.connect': ('_handle_mqtt_connect',),
+        'iot.mqtt.publish': ('_handle_mqtt_publish',),
+        'iot.mqtt.subscribe': ('_handle_mqtt_subscribe',),
+        'iot.http.get': ('_handle_http_request', 'GET'),
+        'iot.http.post': ('_handle_http_request', 'POST'),
+        'iot.http.put': ('_handle_http_request', 'PUT'),
+        'iot.http.delete': ('_handle_http_request', 'DELETE'),
+    }
+    
     def __init__(self, entity_id: str, protocol=None):
         """
         Initialize the IoT plugin.
@@ -35,10 +304,18 @@ class IoTPlugin(DevicePlugin):
         """
         super().__init__(entity_id, 'iot', protocol)
         self.mqtt_client = None
+        # Pooled broker connection behind mqtt_client
+        self._mqtt_shared = None
         self.http_session = None
         self.mqtt_connected = False
         self.mqtt_subscriptions = {}
-        self.mqtt_task = None
+        # Subscribed filters, sharing their handler lists with mqtt_subscriptions
+        self._topic_trie = _TopicTrie()
+        # Requested QoS of each subscribed filter, to restore them on reconnect
+        self._mqtt_sub_qos: Dict[str, int] = {}
+        # Received MQTT messages are handled in order by one worker task
+        self._dispatch_queue: Optional[asyncio.Queue] = None
+        self._dispatch_worker: Optional[asyncio.Task] = None
     
     async def initialize(self) -> bool:
         """
@@ -48,28 +325,18 @@ class IoTPlugin(DevicePlugin):
             Boolean indicating success
         """
         try:
-            # Initialize HTTP session
-            self.http_session = aiohttp.ClientSession()
+            # Use the HTTP session shared with other IoT plugins
+            self.http_session = _acquire_http_session()
             
             # Add capabilities
-            self.capabilities.extend([
-                'iot.mqtt.connect',
-                'iot.mqtt.publish',
-                'iot.mqtt.subscribe',
-                'iot.http.get',
-                'iot.http.post',
-                'iot.http.put',
-                'iot.http.delete'
-            ])
+            self.capabilities.update(self._HANDLERS)
             
             # Register command handlers
-            self.register_command_handler('iot.mqtt.connect', self._handle_mqtt_connect)
-            self.register_command_handler('iot.mqtt.publish', self._handle_mqtt_publish)
-            self.register_command_handler('iot.mqtt.subscribe', self._handle_mqtt_subscribe)
-            self.register_command_handler('iot.http.get', self._handle_http_get)
-            self.register_command_handler('iot.http.post', self._handle_http_post)
-            self.register_command_handler('iot.http.put', self._handle_http_put)
-            self.register_command_handler('iot.http.delete', self._handle_http_delete)
+            for capability, (name, *args) in self._HANDLERS.items():
+                handler = getattr(self, name)
+                if args:
+                    handler = functools.partial(handler, *args)
+                self.register_command_handler(capability, handler)
             
             # Update metadata
             self.metadata.update({
@@ -95,28 +362,23 @@ class IoTPlugin(DevicePlugin):
             Boolean indicating success
         """
         try:
-            # Disconnect MQTT
-            if self.mqtt_client and self.mqtt_connected:
-                try:
-                    # Stop MQTT task
-                    if self.mqtt_task:
-                        self.mqtt_task.cancel()
-                        try:
-                            await self.mqtt_task
-                        except asyncio.CancelledError:
-                            pass
-                        self.mqtt_task = None
-                    
-                    # Disconnect MQTT client
-                    await self.mqtt_client.disconnect()
-                    self.mqtt_connected = False
-                except:
-                    pass
-            
-            # Close HTTP session
+            # Release the MQTT connection and HTTP session concurrently
+            teardown = []
+            if self._dispatch_worker:
+                self._dispatch_worker.cancel()
+                self._dispatch_worker = None
+            if self._mqtt_shared:
+                shared, self._mqtt_shared = self._mqtt_shared, None
+                self.mqtt_client = None
+                self.mqtt_connected = False
+                teardown.append(_release_mqtt_client(shared, self))
             if self.http_session:
-                await self.http_session.close()
                 self.http_session = None
+                teardown.append(_release_http_session())
+            
+            for result in await asyncio.gather(*teardown, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    logger.debug("Ignoring error during IoT teardown: %r", result)
             
             # Shut down base plugin
             await super().shutdown()
@@ -132,8 +394,12 @@ class IoTPlugin(DevicePlugin):
         """
         Handle MQTT connect command.
         
+        Plugins connecting with the same settings share one broker
+        connection; it is closed when the last of them shuts down.
+        
         Args:
-            params: Command parameters (broker, port, username, password, client_id)
+            params: Command parameters (broker, port, username, password, client_id,
+                use_tls, cafile, verify)
             
         Returns:
             Connection result
@@ -169,14 +435,14 @@ class IoTPlugin(DevicePlugin):
                     'error': "asyncio_mqtt module not installed"
                 }
             
-            # Set up TLS if needed
-            tls_context = None
-            if use_tls:
-                tls_context = ssl.create_default_context()
+            # Connections are shared unless a client ID is requested explicitly
+            tls = (params.get('cafile'), params.get('verify', True)) if use_tls else None
+            key = (broker, port, username, password, params.get('client_id'), tls)
             
-            # Connect to MQTT broker
-            try:
-                self.mqtt_client = asyncio_mqtt.Client(
+            def _create_client() -> _SharedMqttClient:
+                # Set up TLS if needed
+                tls_context = _get_tls_context(*tls) if tls else None
+                client = asyncio_mqtt.Client(
                     hostname=broker,
                     port=port,
                     username=username,
@@ -184,11 +450,30 @@ class IoTPlugin(DevicePlugin):
                     client_id=client_id,
                     tls_context=tls_context
                 )
-                await self.mqtt_client.connect()
+                return _SharedMqttClient(key, client, client_id)
+            
+            # Connect to MQTT broker
+            try:
+                # Leave a connection that was lost before reconnecting
+                if self._mqtt_shared:
+                    shared, self._mqtt_shared = self._mqtt_shared, None
+                    await _release_mqtt_client(shared, self)
+                
+                self._mqtt_shared = await _acquire_mqtt_client(key, _create_client, self)
+                self.mqtt_client = self._mqtt_shared.client
                 self.mqtt_connected = True
                 
-                # Start MQTT task
-                self.mqtt_task = asyncio.create_task(self._mqtt_loop())
+                # Only requested filters are subscribed, so a new connection
+                # must be told about the ones made before it
+                for topic, qos in self._mqtt_sub_qos.items():
+                    try:
+                        await self.mqtt_client.subscribe(topic=topic, qos=qos)
+                    except Exception as e:
+                        logger.error(f"Error resubscribing to MQTT topic {topic}: {e}")
+                
+                if self._dispatch_worker is None:
+                    self._dispatch_queue = asyncio.Queue(_DISPATCH_QUEUE_SIZE)
+                    self._dispatch_worker = asyncio.create_task(self._mqtt_dispatch_worker())
                 
                 # Update metadata
                 self.metadata.update({
@@ -203,7 +488,7 @@ class IoTPlugin(DevicePlugin):
                     'success': True,
                     'broker': broker,
                     'port': port,
-                    'client_id': client_id
+                    'client_id': self._mqtt_shared.client_id
                 }
                 
             except Exception as e:
@@ -220,47 +505,98 @@ class IoTPlugin(DevicePlugin):
                 'error': str(e)
             }
     
-    async def _mqtt_loop(self) -> None:
-        """MQTT message loop."""
+    def _on_mqtt_disconnected(self) -> None:
+        """Record that the MQTT connection was lost."""
+        self.mqtt_connected = False
+        self.metadata.update({
+            'mqtt_connected': False
+        })
+    
+    def _dispatch_mqtt(self, topic: str, payload: bytes) -> None:
+        """
+        Queue a received MQTT message for the dispatch worker.
+        
+        Args:
+            topic: Message topic
+            payload: Raw message payload
+        """
+        logger.debug("Received MQTT message: %s - %s", topic, payload)
+        
+        # The connection may be shared; only handle topics subscribed here
+        matches = self._topic_trie.match(topic)
+        if not matches:
+            return
+        
+        # Skip parsing when nothing would consume the message
+        handlers = [handler for matched in matches for handler in matched]
+        broadcast = self.protocol is not None or 'iot.mqtt.message' in self.event_listeners
+        if not handlers and not broadcast:
+            return
+        
         try:
-            async with self.mqtt_client.filtered_messages('#') as messages:
-                await self.mqtt_client.subscribe('#')
-                async for message in messages:
-                    topic = message.topic.value
-                    payload = message.payload.decode()
-                    
-                    logger.debug(f"Received MQTT message: {topic} - {payload}")
-                    
-                    # Try to parse payload as JSON
-                    try:
-                        payload_data = json.loads(payload)
-                    except json.JSONDecodeError:
-                        payload_data = payload
-                    
-                    # Emit event
-                    await self.emit_event('iot.mqtt.message', {
-                        'topic': topic,
-                        'payload': payload_data
-                    })
-                    
-                    # Call subscribed handlers
-                    if topic in self.mqtt_subscriptions:
-                        for handler in self.mqtt_subscriptions[topic]:
-                            try:
-                                await handler(topic, payload_data)
-                            except Exception as e:
-                                logger.error(f"Error in MQTT handler: {e}")
-                    
-        except asyncio.CancelledError:
-            # Task was cancelled, exit
-            pass
-            
-        except Exception as e:
-            logger.error(f"Error in MQTT loop: {e}")
-            self.mqtt_connected = False
-            self.metadata.update({
-                'mqtt_connected': False
-            })
+            self._dispatch_queue.put_nowait((topic, payload, handlers, broadcast))
+        except asyncio.QueueFull:
+            logger.warning(f"MQTT dispatch queue full, dropping message on {topic}")
+    
+    async def _mqtt_dispatch_worker(self) -> None:
+        """Deliver queued MQTT messages until the plugin shuts down."""
+        # Bound once; this loop runs for every received message
+        get = self._dispatch_queue.get
+        deliver = self._deliver_mqtt
+        while True:
+            message = await get()
+            try:
+                await deliver(*message)
+            except Exception as e:
+                logger.error(f"Error dispatching MQTT message: {e}")
+    
+    async def _deliver_mqtt(self, topic: str, payload: bytes, handlers: List[Callable],
+                            broadcast: bool) -> None:
+        """
+        Deliver an MQTT message to topic handlers and event listeners.
+        
+        Plain-function handlers are called first; the awaitables they and
+        the event broadcast produce then run concurrently, so one slow
+        handler does not delay the others and a failing handler does not
+        cancel them.
+        
+        Args:
+            topic: Message topic
+            payload: Raw message payload
+            handlers: Handlers of the subscribed filters matching the topic
+            broadcast: Whether to emit an 'iot.mqtt.message' event
+        """
+        # Parse JSON payloads straight from the raw bytes
+        if payload and payload[0] in _JSON_START:
+            try:
+                payload_data = _json_loads(payload)
+            except ValueError:
+                payload_data = payload.decode('utf-8', 'replace')
+        else:
+            payload_data = payload.decode('utf-8', 'replace')
+        
+        pending = []
+        
+        # Emit event
+        if broadcast:
+            pending.append(self.emit_event('iot.mqtt.message', {
+                'topic': topic,
+                'payload': payload_data
+            }))
+        
+        # Call subscribed handlers
+        for handler in handlers:
+            try:
+                result = handler(topic, payload_data)
+                if inspect.isawaitable(result):
+                    pending.append(result)
+            except Exception as e:
+                logger.error(f"Error in MQTT handler: {e}")
+        
+        if pending:
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Error in MQTT handler: {result}")
     
     async def _handle_mqtt_publish(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -292,19 +628,30 @@ class IoTPlugin(DevicePlugin):
                     'error': "Missing topic or payload parameter"
                 }
             
-            # Convert payload to JSON string if it's a dict
-            if isinstance(payload, dict):
-                payload = json.dumps(payload)
-            
-            # Publish message
-            await self.mqtt_client.publish(
-                topic=topic,
-                payload=payload,
-                qos=qos,
-                retain=retain
-            )
+            # Send bytes as-is and everything else as UTF-8 text or JSON
+            if isinstance(payload, str):
+                payload = payload.encode('utf-8')
+            elif not isinstance(payload, (bytes, bytearray, memoryview)):
+                payload = _json_dumps(payload)
+            
+            # Publish message; QoS 0 has no acknowledgement to wait for, so
+            # hand it straight to paho instead of going through a coroutine
+            if qos == 0:
+                info = self.mqtt_client._client.publish(topic, payload, qos=0, retain=retain)
+                if info.rc != 0:
+                    return {
+                        'success': False,
+                        'error': f"MQTT publish failed with code {info.rc}"
+                    }
+            else:
+                await self.mqtt_client.publish(
+                    topic=topic,
+                    payload=payload,
+                    qos=qos,
+                    retain=retain
+                )
             
-            logger.debug(f"Published MQTT message: {topic} - {payload}")
+            logger.debug("Published MQTT message: %s - %s", topic, payload)
             
             return {
                 'success': True,
@@ -348,13 +695,19 @@ class IoTPlugin(DevicePlugin):
                     'error': "Missing topic parameter"
                 }
             
+            # Only filters requested here are received
+            if topic not in self.mqtt_subscriptions:
+                self.mqtt_subscriptions[topic] = []
+                self._topic_trie.insert(topic, self.mqtt_subscriptions[topic])
+            
             # Subscribe to topic
             await self.mqtt_client.subscribe(
                 topic=topic,
                 qos=qos
             )
+            self._mqtt_sub_qos[topic] = qos
             
-            logger.debug(f"Subscribed to MQTT topic: {topic}")
+            logger.debug("Subscribed to MQTT topic: %s", topic)
             
             return {
                 'success': True,
@@ -369,134 +722,20 @@ class IoTPlugin(DevicePlugin):
                 'error': str(e)
             }
     
-    async def _handle_http_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Handle HTTP GET command.
-        
-        Args:
-            params: Command parameters (url, headers, params)
-            
-        Returns:
-            HTTP response
-        """
-        try:
-            # Check if HTTP session is available
-            if not self.http_session:
-                return {
-                    'success': False,
-                    'error': "HTTP session not available"
-                }
-            
-            # Get parameters
-            url = params.get('url')
-            headers = params.get('headers', {})
-            query_params = params.get('params', {})
-            
-            if not url:
-                return {
-                    'success': False,
-                    'error': "Missing url parameter"
-                }
-            
-            # Send GET request
-            async with self.http_session.get(
-                url=url,
-                headers=headers,
-                params=query_params
-            ) as response:
-                status = response.status
-                
-                # Get response content
-                try:
-                    content = await response.json()
-                except:
-                    content = await response.text()
-                
-                logger.debug(f"HTTP GET response: {status} - {url}")
-                
-                return {
-                    'success': status < 400,
-                    'status': status,
-                    'url': url,
-                    'content': content,
-                    'headers': dict(response.headers)
-                }
-            
-        except Exception as e:
-            logger.error(f"Error handling HTTP GET: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
-    
-    async def _handle_http_post(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_http_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Handle HTTP POST command.
+        Handle an HTTP request command.
         
-        Args:
-            params: Command parameters (url, headers, data, json)
-            
-        Returns:
-            HTTP response
-        """
-        try:
-            # Check if HTTP session is available
-            if not self.http_session:
-                return {
-                    'success': False,
-                    'error': "HTTP session not available"
-                }
-            
-            # Get parameters
-            url = params.get('url')
-            headers = params.get('headers', {})
-            data = params.get('data')
-            json_data = params.get('json')
-            
-            if not url:
-                return {
-                    'success': False,
-                    'error': "Missing url parameter"
-                }
-            
-            # Send POST request
-            async with self.http_session.post(
-                url=url,
-                headers=headers,
-                data=data,
-                json=json_data
-            ) as response:
-                status = response.status
-                
-                # Get response content
-                try:
-                    content = await response.json()
-                except:
-                    content = await response.text()
-                
-                logger.debug(f"HTTP POST response: {status} - {url}")
-                
-                return {
-                    'success': status < 400,
-                    'status': status,
-                    'url': url,
-                    'content': content,
-                    'headers': dict(response.headers)
-                }
-            
-        except Exception as e:
-            logger.error(f"Error handling HTTP POST: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
-    
-    async def _handle_http_put(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Handle HTTP PUT command.
+        With the stream parameter set, the body is not buffered: each chunk
+        is emitted as an 'iot.http.chunk' event while it arrives and the
+        result reports the number of bytes received instead of content.
+        Response headers are only copied into the result when the
+        include_headers parameter is set.
         
         Args:
-            params: Command parameters (url, headers, data, json)
+            method: HTTP method (GET, POST, PUT, DELETE)
+            params: Command parameters (url, headers, params, data, json, stream,
+                include_headers)
             
         Returns:
             HTTP response
@@ -511,9 +750,6 @@ class IoTPlugin(DevicePlugin):
             
             # Get parameters
             url = params.get('url')
-            headers = params.get('headers', {})
-            data = params.get('data')
-            json_data = params.get('json')
             
             if not url:
                 return {
@@ -521,91 +757,64 @@ class IoTPlugin(DevicePlugin):
                     'error': "Missing url parameter"
                 }
             
-            # Send PUT request
-            async with self.http_session.put(
-                url=url,
-                headers=headers,
-                data=data,
-                json=json_data
-            ) as response:
-                status = response.status
-                
-                # Get response content
-                try:
-                    content = await response.json()
-                except:
-                    content = await response.text()
-                
-                logger.debug(f"HTTP PUT response: {status} - {url}")
-                
-                return {
-                    'success': status < 400,
-                    'status': status,
-                    'url': url,
-                    'content': content,
-                    'headers': dict(response.headers)
-                }
-            
-        except Exception as e:
-            logger.error(f"Error handling HTTP PUT: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
-    
-    async def _handle_http_delete(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Handle HTTP DELETE command.
-        
-        Args:
-            params: Command parameters (url, headers)
-            
-        Returns:
-            HTTP response
-        """
-        try:
-            # Check if HTTP session is available
-            if not self.http_session:
-                return {
-                    'success': False,
-                    'error': "HTTP session not available"
-                }
-            
-            # Get parameters
-            url = params.get('url')
-            headers = params.get('headers', {})
-            
-            if not url:
-                return {
-                    'success': False,
-                    'error': "Missing url parameter"
-                }
+            stream = params.get('stream', False)
             
-            # Send DELETE request
-            async with self.http_session.delete(
+            # Send request
+            async with self.http_session.request(
+                method,
                 url=url,
-                headers=headers
+                headers=params.get('headers'),
+                params=params.get('params'),
+                data=params.get('data'),
+                json=params.get('json'),
+                timeout=_STREAM_TIMEOUT if stream else self.http_session.timeout
             ) as response:
                 status = response.status
                 
-                # Get response content
-                try:
-                    content = await response.json()
-                except:
-                    content = await response.text()
+                if stream:
+                    # Forward the body in bounded chunks as it arrives
+                    received = 0
+                    async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                        received += len(chunk)
+                        await self.emit_event('iot.http.chunk', {
+                            'url': url,
+                            'data': chunk
+                        })
+                    
+                    logger.debug("HTTP %s streamed response: %s - %s", method, status, url)
+                    
+                    result = {
+                        'success': status < 400,
+                        'status': status,
+                        'url': url,
+                        'bytes': received
+                    }
+                else:
+                    # Get response content; only JSON content types are parsed
+                    if 'json' in response.content_type:
+                        try:
+                            content = _json_loads(await response.read())
+                        except ValueError:
+                            content = await response.text()
+                    else:
+                        content = await response.text()
+                    
+                    logger.debug("HTTP %s response: %s - %s", method, status, url)
+                    
+                    result = {
+                        'success': status < 400,
+                        'status': status,
+                        'url': url,
+                        'content': content
+                    }
                 
-                logger.debug(f"HTTP DELETE response: {status} - {url}")
+                if params.get('include_headers'):
+                    result['headers'] = dict(response.headers)
                 
-                return {
-                    'success': status < 400,
-                    'status': status,
-                    'url': url,
-                    'content': content,
-                    'headers': dict(response.headers)
-                }
+                return result
             
         except Exception as e:
-            logger.error(f"Error handling HTTP DELETE: {e}")
+            logger.error(f"Error handling HTTP {method}: {e}")
             return {
                 'success': False,
                 'error': str(e)
@@ -7,13 +7,356 @@ camera interfaces, and GPIO.
 """
 
 import os
+import array
+import asyncio
+import ctypes
+import ctypes.util
+import fcntl
+import glob
 import json
 import logging
+import re
+import struct
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+try:
+    import Jetson.GPIO as _GPIO
+except Exception:
+    # Missing, or raised at import because the board is not recognised
+    _GPIO = None
+
+try:
+    import cv2 as _cv2
+except ImportError:
+    _cv2 = None
+
+try:
+    # libjpeg-turbo's SIMD encoder; needs the shared library as well
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbojpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbojpeg = None
+
+try:
+    import pynvml as _pynvml
+except ImportError:
+    _pynvml = None
+
+try:
+    import numpy as _np
+    import pycuda.driver as _cuda
+    import tensorrt as _trt
+except ImportError:
+    _trt = None
+
+
+def _read_small(path: str, size: int = 4096) -> bytes:
+    """
+    Read up to size bytes of a small procfs/sysfs/device-tree file with a
+    single read call, without a buffered file object.
+    
+    Args:
+        path: File to read
+        size: Maximum number of bytes to read
+        
+    Returns:
+        File contents
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    """
+    Read a small procfs/sysfs/device-tree file directly.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        File contents without trailing NULs and whitespace, or None if the
+        file is not readable
+    """
+    try:
+        return _read_small(path).decode(errors='ignore').rstrip('\x00').strip()
+    except OSError:
+        return None
+
+
+# Read once at import; neither changes while the process runs
+_PROC_DEVICE_MODEL = _read_sysfs('/proc/device-tree/model')
+_IS_JETSON = os.path.exists('/etc/nv_tegra_release')
+
+# CUDA runtime locations tried after the linker search path; Jetson
+# images keep libcudart under the aarch64 target directory
+_CUDART_PATTERNS = (
+    '/usr/local/cuda*/targets/aarch64-linux/lib/libcudart.so*',
+    '/usr/local/cuda*/lib64/libcudart.so*',
+)
+
+# cudaDeviceAttr values for the compute capability
+_CUDA_ATTR_CC_MAJOR = 75
+_CUDA_ATTR_CC_MINOR = 76
+
+# cudaDeviceProp starts with the 256-byte device name; the rest of the
+# struct varies between CUDA versions, so only the name is read from it
+_CUDA_PROP_SIZE = 4096
+_CUDA_NAME_SIZE = 256
+
+# Loaded CUDA runtime; False once loading it has failed
+_cudart = None
+
+
+def _load_cudart() -> Optional[ctypes.CDLL]:
+    """
+    Load the CUDA runtime library on first use.
+    
+    Returns:
+        CUDA runtime library, or None if it is not installed
+    """
+    global _cudart
+    if _cudart is None:
+        _cudart = False
+        candidates = [ctypes.util.find_library('cudart')]
+        for pattern in _CUDART_PATTERNS:
+            candidates.extend(sorted(glob.glob(pattern)))
+        for candidate in candidates:
+            if not candidate:
+                continue
+            try:
+                _cudart = ctypes.CDLL(candidate)
+                break
+            except OSError:
+                continue
+    return _cudart or None
+
+
+def _cuda_device_count() -> Optional[int]:
+    """
+    Count CUDA devices through the CUDA runtime.
+    
+    Returns:
+        Number of CUDA devices, or None if the runtime is not available
+    """
+    cudart = _load_cudart()
+    if cudart is None:
+        return None
+    count = ctypes.c_int(0)
+    if cudart.cudaGetDeviceCount(ctypes.byref(count)) != 0:
+        return 0
+    return count.value
+
+
+def _cuda_device_properties(memory_mb: int, device: int = 0) -> Optional[Dict[str, str]]:
+    """
+    Get the name, total memory and compute capability of a CUDA device.
+    
+    The Jetson GPU shares system memory, so its total memory is the
+    MemTotal of /proc/meminfo; cudaMemGetInfo would create a CUDA context
+    in this process just to report it.
+    
+    Args:
+        memory_mb: Total system memory in MiB
+        device: CUDA device index
+        
+    Returns:
+        GPU information, or None if the runtime is not available or fails
+    """
+    cudart = _load_cudart()
+    if cudart is None:
+        return None
+    
+    props = ctypes.create_string_buffer(_CUDA_PROP_SIZE)
+    major = ctypes.c_int(0)
+    minor = ctypes.c_int(0)
+    if (cudart.cudaGetDeviceProperties(props, device) != 0 or
+            cudart.cudaDeviceGetAttribute(ctypes.byref(major), _CUDA_ATTR_CC_MAJOR, device) != 0 or
+            cudart.cudaDeviceGetAttribute(ctypes.byref(minor), _CUDA_ATTR_CC_MINOR, device) != 0):
+        return None
+    
+    return {
+        'name': props.raw[:_CUDA_NAME_SIZE].split(b'\x00', 1)[0].decode(errors='ignore'),
+        'memory': f"{memory_mb} MiB",
+        'compute_capability': f"{major.value}.{minor.value}"
+    }
+
+
+# VIDIOC_QUERYCAP ioctl and the layout of struct v4l2_capability:
+# driver[16], card[32], bus_info[32], version, capabilities, device_caps,
+# reserved[3]
+_VIDIOC_QUERYCAP = 0x80685600
+_V4L2_CAPABILITY = struct.Struct('16s32s32sIII12x')
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_VIDEO_CAPTURE_MPLANE = 0x00001000
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+def _query_v4l2_capability(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Query a V4L2 device node for its driver and card name.
+    
+    Args:
+        path: Device node path
+        
+    Returns:
+        Tuple of driver and card name, or None if the node cannot capture video
+        
+    Raises:
+        OSError: If the node cannot be opened or queried
+    """
+    buf = bytearray(_V4L2_CAPABILITY.size)
+    fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+    finally:
+        os.close(fd)
+    
+    driver, card, _, _, capabilities, device_caps = _V4L2_CAPABILITY.unpack(buf)
+    if capabilities & _V4L2_CAP_DEVICE_CAPS:
+        capabilities = device_caps
+    if not capabilities & (_V4L2_CAP_VIDEO_CAPTURE | _V4L2_CAP_VIDEO_CAPTURE_MPLANE):
+        return None
+    
+    return (driver.split(b'\x00', 1)[0].decode(errors='ignore'),
+            card.split(b'\x00', 1)[0].decode(errors='ignore'))
+
+
+# Jetson CSI capture: frames stay in NVMM memory and are JPEG-encoded by
+# the hardware encoder; the appsink only holds the newest frame
+_CSI_PIPELINE = (
+    'nvarguscamerasrc sensor-id={sensor_id} ! '
+    'video/x-raw(memory:NVMM),width={width},height={height},framerate=30/1 ! '
+    'nvjpegenc ! image/jpeg ! appsink drop=true max-buffers=1'
+)
+
+# USB (UVC) capture: raw frames are copied into NVMM memory by the VIC and
+# JPEG-encoded by the same hardware encoder as CSI frames
+_V4L2_PIPELINE = (
+    'v4l2src device={path} ! '
+    'video/x-raw,width={width},height={height} ! '
+    'nvvidconv ! video/x-raw(memory:NVMM) ! '
+    'nvjpegenc ! image/jpeg ! appsink drop=true max-buffers=1'
+)
+
+# Total memory line of /proc/meminfo, in kB
+_MEMTOTAL_RE = re.compile(rb'^MemTotal:\s+(\d+)', re.M)
+
+# GPIO pin arrays are indexed by header pin number, 1-40
+_HEADER_SIZE = 41
+_MODE_INPUT = 0
+_MODE_OUTPUT = 1
+_STATE_UNKNOWN = -1
+
+# Power and ground pins of the 40-pin header
+_RESERVED_PINS = frozenset({1, 2, 4, 6, 9, 14, 17, 20, 25, 30, 34, 39})
+
+# Device-tree model substrings mapped to common names; the longest
+# matching substring wins, so 'Orin Nano' is not taken for 'Nano'
+_JETSON_MODELS = {
+    'Orin Nano': 'Jetson Orin Nano',
+    'Orin NX': 'Jetson Orin NX',
+    'AGX Orin': 'Jetson AGX Orin',
+    'Xavier NX': 'Jetson Xavier NX',
+    'AGX Xavier': 'Jetson AGX Xavier',
+    'Nano': 'Jetson Nano',
+}
+
+
+def _classify_jetson_model(model: Optional[str]) -> Optional[str]:
+    """
+    Map a device-tree model string to a common Jetson name.
+    
+    Args:
+        model: Device-tree model string
+        
+    Returns:
+        Common name, the model string itself if it is not recognised, or
+        None if there is no model string
+    """
+    if model is None:
+        return None
+    matches = [key for key in _JETSON_MODELS if key in model]
+    if not matches:
+        return model
+    return _JETSON_MODELS[max(matches, key=len)]
+
+
+# Classified once, like the model string it comes from
+_JETSON_MODEL_NAME = _classify_jetson_model(_PROC_DEVICE_MODEL)
+
+class _TrtEngine:
+    """
+    TensorRT engine loaded once, with its execution context, CUDA stream
+    and pre-allocated page-locked host and device buffers.
+    """
+    
+    def __init__(self, model_path: str):
+        """
+        Deserialize an engine and allocate its I/O buffers.
+        
+        Args:
+            model_path: Path to the serialized TensorRT engine
+        """
+        # Creates the CUDA context on first use
+        import pycuda.autoinit  # noqa: F401
+        
+        self.runtime = _trt.Runtime(_trt.Logger(_trt.Logger.WARNING))
+        with open(model_path, 'rb') as f:
+            self.engine = self.runtime.deserialize_cuda_engine(f.read())
+        if self.engine is None:
+            raise RuntimeError(f"Failed to deserialize TensorRT engine: {model_path}")
+        
+        self.context = self.engine.create_execution_context()
+        self.stream = _cuda.Stream()
+        self.bindings = []
+        self.inputs = []
+        self.outputs = []
+        for i in range(self.engine.num_bindings):
+            size = _trt.volume(self.engine.get_binding_shape(i))
+            dtype = _trt.nptype(self.engine.get_binding_dtype(i))
+            host = _cuda.pagelocked_empty(size, dtype)
+            device = _cuda.mem_alloc(host.nbytes)
+            self.bindings.append(int(device))
+            if self.engine.binding_is_input(i):
+                self.inputs.append((host, device))
+            else:
+                self.outputs.append((host, device))
+    
+    def infer(self, input_data: bytes) -> List[Any]:
+        """
+        Run the engine on one input.
+        
+        Args:
+            input_data: Raw input tensor, in the engine's input layout and dtype
+            
+        Returns:
+            Output tensors as flat numpy arrays
+        """
+        host_in, device_in = self.inputs[0]
+        data = _np.frombuffer(input_data, dtype=host_in.dtype)
+        if data.size != host_in.size:
+            raise ValueError(f"Expected {host_in.size} input values, got {data.size}")
+        host_in[:] = data
+        
+        _cuda.memcpy_htod_async(device_in, host_in, self.stream)
+        self.context.execute_async_v2(bindings=self.bindings, stream_handle=self.stream.handle)
+        for host, device in self.outputs:
+            _cuda.memcpy_dtoh_async(host, device, self.stream)
+        self.stream.synchronize()
+        
+        return [host.copy() for host, _ in self.outputs]
+
+
 class JetsonPlugin:
     """
     Plugin for NVIDIA Jetson devices.
@@ -27,24 +370,51 @@ class JetsonPlugin:
         self.jetson_model = None
         self.cuda_available = False
         self.camera_devices = {}
-        self.gpio_pins = {}
+        # Usable header pins, with per-pin mode and last known state
+        # indexed by pin number
+        self.gpio_pins: frozenset = frozenset()
+        self.gpio_modes = array.array('b', [_MODE_INPUT] * _HEADER_SIZE)
+        self.gpio_states = array.array('b', [_STATE_UNKNOWN] * _HEADER_SIZE)
+        # Jetson.GPIO functions and constants, bound once GPIO is set up
+        self._gpio_setup = None
+        self._gpio_output = None
+        self._gpio_input = None
+        self._gpio_in = None
+        self._gpio_out = None
+        # Open camera handles and their resolution, keyed by camera ID
+        self._captures: Dict[str, Tuple[Any, Tuple[int, int], bool]] = {}
+        # Cameras whose hardware-encoding pipeline could not be opened
+        self._software_cameras: set = set()
+        # TensorRT engines loaded by run_inference, keyed by model path
+        self._trt_engines: Dict[str, _TrtEngine] = {}
+        # Engines are loaded and run on one thread, which holds their CUDA context
+        self._trt_executor: Optional[ThreadPoolExecutor] = None
+        # NVML handle of the GPU, opened on first use
+        self._nvml_handle = None
+        # Device information collected on first request
+        self._device_info_cache: Optional[Dict[str, Any]] = None
         
     async def initialize(self):
         """Initialize the Jetson plugin."""
         try:
             # Check if running on a Jetson device
-            if not os.path.exists('/etc/nv_tegra_release'):
+            if not _IS_JETSON:
                 logger.warning("Not running on a Jetson device. Jetson plugin will be disabled.")
                 return
             
+            # Forget information from a previous initialization
+            self.reset()
+            
             # Detect Jetson model
             self.jetson_model = self._detect_jetson_model()
             
-            # Check CUDA availability
-            self.cuda_available = self._check_cuda_availability()
-            
-            # Detect camera devices
-            self.camera_devices = self._detect_camera_devices()
+            # Check CUDA availability and detect camera devices concurrently;
+            # both block on library loads, ioctls or subprocesses
+            loop = asyncio.get_running_loop()
+            self.cuda_available, self.camera_devices = await asyncio.gather(
+                loop.run_in_executor(None, self._check_cuda_availability),
+                loop.run_in_executor(None, self._detect_camera_devices)
+            )
             
             # Initialize GPIO
             self._initialize_gpio()
@@ -63,31 +433,10 @@ class JetsonPlugin:
         Returns:
             Jetson model name
         """
-        try:
-            # Try to use the Jetson-specific utility
-            result = subprocess.run(['cat', '/proc/device-tree/model'], 
-                                   capture_output=True, text=True, check=True)
-            model = result.stdout.strip()
-            
-            # Map to common names
-            if 'Nano' in model:
-                return 'Jetson Nano'
-            elif 'Xavier NX' in model:
-                return 'Jetson Xavier NX'
-            elif 'AGX Xavier' in model:
-                return 'Jetson AGX Xavier'
-            elif 'Orin Nano' in model:
-                return 'Jetson Orin Nano'
-            elif 'Orin NX' in model:
-                return 'Jetson Orin NX'
-            elif 'AGX Orin' in model:
-                return 'Jetson AGX Orin'
-            else:
-                return model
-            
-        except Exception as e:
-            logger.error(f"Failed to detect Jetson model: {e}")
+        if _JETSON_MODEL_NAME is None:
+            logger.error("Failed to detect Jetson model: /proc/device-tree/model is not readable")
             return "Unknown Jetson"
+        return _JETSON_MODEL_NAME
     
     def _check_cuda_availability(self) -> bool:
         """
@@ -97,6 +446,11 @@ class JetsonPlugin:
             True if CUDA is available, False otherwise
         """
         try:
+            # Ask the CUDA runtime directly when it can be loaded
+            count = _cuda_device_count()
+            if count is not None:
+                return count > 0
+            
             # Check for CUDA libraries
             cuda_path = '/usr/local/cuda'
             if not os.path.exists(cuda_path):
@@ -115,49 +469,49 @@ class JetsonPlugin:
         """
         Detect available camera devices.
         
+        Each /dev/video* node is queried with VIDIOC_QUERYCAP; nodes that
+        cannot capture video, such as UVC metadata nodes, are skipped.
+        
         Returns:
             Dictionary of camera devices
         """
         cameras = {}
         
         try:
-            # Check for V4L2 devices
-            if os.path.exists('/dev/video0'):
-                # Get camera info using v4l2-ctl
-                for i in range(10):  # Check up to 10 cameras
-                    device_path = f'/dev/video{i}'
-                    if not os.path.exists(device_path):
-                        continue
-                    
-                    try:
-                        result = subprocess.run(['v4l2-ctl', '--device', device_path, '--all'], 
-                                              capture_output=True, text=True)
-                        
-                        # Extract camera info
-                        camera_info = {
-                            'path': device_path,
-                            'type': 'v4l2'
-                        }
-                        
-                        # Try to extract camera name
-                        for line in result.stdout.split('\n'):
-                            if 'Card type' in line:
-                                camera_info['name'] = line.split(':')[1].strip()
-                                break
-                        
-                        cameras[f'camera{i}'] = camera_info
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to get info for camera {device_path}: {e}")
-            
-            # Check for CSI cameras
-            csi_path = '/dev/video0'
-            if os.path.exists(csi_path):
-                cameras['csi0'] = {
-                    'path': csi_path,
-                    'type': 'csi',
-                    'name': 'CSI Camera'
-                }
+            # One directory listing instead of probing each node
+            indices = sorted(int(name[5:]) for name in os.listdir('/dev')
+                             if name.startswith('video') and name[5:].isdigit())
+            
+            csi_count = 0
+            for index in indices:
+                device_path = f'/dev/video{index}'
+                try:
+                    cap = _query_v4l2_capability(device_path)
+                except OSError as e:
+                    logger.error(f"Failed to get info for camera {device_path}: {e}")
+                    continue
+                
+                if cap is None:
+                    continue
+                driver, card = cap
+                
+                # CSI sensors are served by the Tegra video input driver
+                if 'tegra' in driver or 'nvcsi' in driver:
+                    cameras[f'csi{csi_count}'] = {
+                        'path': device_path,
+                        'type': 'csi',
+                        'name': card,
+                        'driver': driver,
+                        'sensor_id': csi_count
+                    }
+                    csi_count += 1
+                else:
+                    cameras[f'camera{index}'] = {
+                        'path': device_path,
+                        'type': 'v4l2',
+                        'name': card,
+                        'driver': driver
+                    }
                 
         except Exception as e:
             logger.error(f"Failed to detect camera devices: {e}")
@@ -166,96 +520,163 @@ class JetsonPlugin:
     
     def _initialize_gpio(self):
         """Initialize GPIO pins."""
+        if _GPIO is None:
+            logger.warning("Jetson.GPIO module not found. GPIO functionality will be disabled.")
+            return
+        
         try:
-            # Try to import Jetson.GPIO
-            import Jetson.GPIO as GPIO
-            
             # Set up GPIO
-            GPIO.setmode(GPIO.BOARD)
+            _GPIO.setmode(_GPIO.BOARD)
+            self._gpio_setup = _GPIO.setup
+            self._gpio_output = _GPIO.output
+            self._gpio_input = _GPIO.input
+            self._gpio_in = _GPIO.IN
+            self._gpio_out = _GPIO.OUT
             
-            # Map available pins
-            for pin in range(1, 41):
-                try:
-                    # Check if pin is valid
-                    if pin in [1, 2, 4, 6, 9, 14, 17, 20, 25, 30, 34, 39]:
-                        # Power or ground pins
-                        continue
-                    
-                    self.gpio_pins[pin] = {
-                        'pin': pin,
-                        'mode': 'input',  # Default mode
-                        'state': None
-                    }
-                    
-                except Exception:
-                    # Skip pins that can't be initialized
-                    pass
+            # Map available pins, skipping power and ground
+            self.gpio_pins = frozenset(range(1, _HEADER_SIZE)) - _RESERVED_PINS
             
             logger.debug(f"Initialized {len(self.gpio_pins)} GPIO pins")
             
-        except ImportError:
-            logger.warning("Jetson.GPIO module not found. GPIO functionality will be disabled.")
         except Exception as e:
             logger.error(f"Failed to initialize GPIO: {e}")
     
-    async def get_device_info(self) -> Dict[str, Any]:
+    async def get_device_info(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get information about the Jetson device.
         
+        The information is collected on the first call and cached, since
+        it does not change while the process runs.
+        
+        Args:
+            refresh: Whether to query the GPU information again
+            
         Returns:
             Dictionary of device information
         """
         if not self.jetson_initialized:
             return {'error': 'Jetson plugin not initialized'}
         
+        if self._device_info_cache is None:
+            self._device_info_cache = self._collect_device_info()
+        elif refresh and self.cuda_available:
+            gpu = self._get_gpu_info(self._device_info_cache.get('memory_mb'))
+            if gpu is not None:
+                self._device_info_cache['gpu'] = gpu
+        
+        return dict(self._device_info_cache)
+    
+    def reset(self):
+        """Discard the cached device information."""
+        self._device_info_cache = None
+    
+    def _collect_device_info(self) -> Dict[str, Any]:
+        """
+        Collect information about the Jetson device.
+        
+        Returns:
+            Dictionary of device information
+        """
         info = {
             'model': self.jetson_model,
             'cuda_available': self.cuda_available,
             'camera_devices': list(self.camera_devices.keys()),
-            'gpio_pins': list(self.gpio_pins.keys())
+            'gpio_pins': sorted(self.gpio_pins)
         }
         
         # Get additional system info
         try:
-            # Get CPU info
-            with open('/proc/cpuinfo', 'r') as f:
-                cpuinfo = f.read()
-            
-            # Extract CPU count
-            cpu_count = cpuinfo.count('processor')
-            info['cpu_count'] = cpu_count
+            # Get CPU count; the affinity mask honours cgroup and power-mode
+            # restrictions on which cores this process may use
+            if hasattr(os, 'sched_getaffinity'):
+                info['cpu_count'] = len(os.sched_getaffinity(0))
+            else:
+                info['cpu_count'] = os.cpu_count()
             
-            # Get memory info
-            with open('/proc/meminfo', 'r') as f:
-                meminfo = f.read()
+            # Get memory info; MemTotal is on the first line
+            meminfo = _read_small('/proc/meminfo', 256)
             
             # Extract total memory
-            for line in meminfo.split('\n'):
-                if 'MemTotal' in line:
-                    mem_kb = int(line.split(':')[1].strip().split(' ')[0])
-                    info['memory_mb'] = mem_kb // 1024
-                    break
+            match = _MEMTOTAL_RE.search(meminfo)
+            if match:
+                info['memory_mb'] = int(match.group(1)) // 1024
             
             # Get CUDA info if available
             if self.cuda_available:
-                try:
-                    result = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total,compute_cap', '--format=csv,noheader'], 
-                                          capture_output=True, text=True, check=True)
-                    
-                    gpu_info = result.stdout.strip().split(',')
-                    info['gpu'] = {
-                        'name': gpu_info[0].strip(),
-                        'memory': gpu_info[1].strip(),
-                        'compute_capability': gpu_info[2].strip()
-                    }
-                except Exception as e:
-                    logger.error(f"Failed to get GPU info: {e}")
+                gpu = self._get_gpu_info(info.get('memory_mb'))
+                if gpu is not None:
+                    info['gpu'] = gpu
             
         except Exception as e:
             logger.error(f"Failed to get system info: {e}")
         
         return info
     
+    def _get_gpu_info(self, memory_mb: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """
+        Get the GPU name, memory and compute capability.
+        
+        Args:
+            memory_mb: Total system memory in MiB, if known
+            
+        Returns:
+            GPU information, or None if it could not be determined
+        """
+        # Prefer in-process queries over spawning nvidia-smi
+        gpu = _cuda_device_properties(memory_mb) if memory_mb is not None else None
+        if gpu is None:
+            gpu = self._get_nvml_gpu_info()
+        if gpu is not None:
+            return gpu
+        
+        try:
+            result = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total,compute_cap', '--format=csv,noheader'], 
+                                  capture_output=True, text=True, check=True)
+            
+            # One CSV line per GPU; report the first, like the other queries
+            name, memory, compute_capability = (
+                field.strip() for field in result.stdout.strip().splitlines()[0].split(',', 2)
+            )
+            return {
+                'name': name,
+                'memory': memory,
+                'compute_capability': compute_capability
+            }
+        except Exception as e:
+            logger.error(f"Failed to get GPU info: {e}")
+            return None
+    
+    def _get_nvml_gpu_info(self) -> Optional[Dict[str, str]]:
+        """
+        Get the GPU name, memory and compute capability through NVML.
+        
+        Returns:
+            GPU information, or None if NVML is not available
+        """
+        if _pynvml is None:
+            return None
+        
+        try:
+            if self._nvml_handle is None:
+                _pynvml.nvmlInit()
+                self._nvml_handle = _pynvml.nvmlDeviceGetHandleByIndex(0)
+            handle = self._nvml_handle
+            
+            name = _pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode(errors='ignore')
+            total = _pynvml.nvmlDeviceGetMemoryInfo(handle).total
+            major, minor = _pynvml.nvmlDeviceGetCudaComputeCapability(handle)
+            return {
+                'name': name,
+                'memory': f"{total // (1024 * 1024)} MiB",
+                'compute_capability': f"{major}.{minor}"
+            }
+        except Exception as e:
+            # Some L4T releases ship a libnvidia-ml that fails to initialise
+            logger.debug("NVML query failed: %s", e)
+            return None
+    
     async def set_gpio_mode(self, pin: int, mode: str) -> bool:
         """
         Set the mode of a GPIO pin.
@@ -271,17 +692,15 @@ class JetsonPlugin:
             return False
         
         try:
-            import Jetson.GPIO as GPIO
-            
             if mode == 'input':
-                GPIO.setup(pin, GPIO.IN)
+                self._gpio_setup(pin, self._gpio_in)
             elif mode == 'output':
-                GPIO.setup(pin, GPIO.OUT)
+                self._gpio_setup(pin, self._gpio_out)
             else:
                 logger.error(f"Invalid GPIO mode: {mode}")
                 return False
             
-            self.gpio_pins[pin]['mode'] = mode
+            self.gpio_modes[pin] = _MODE_INPUT if mode == 'input' else _MODE_OUTPUT
             return True
             
         except Exception as e:
@@ -302,15 +721,13 @@ class JetsonPlugin:
         if not self.jetson_initialized or pin not in self.gpio_pins:
             return False
         
-        if self.gpio_pins[pin]['mode'] != 'output':
+        if self.gpio_modes[pin] != _MODE_OUTPUT:
             logger.error(f"Pin {pin} is not set as output")
             return False
         
         try:
-            import Jetson.GPIO as GPIO
-            
-            GPIO.output(pin, value)
-            self.gpio_pins[pin]['state'] = value
+            self._gpio_output(pin, value)
+            self.gpio_states[pin] = value
             return True
             
         except Exception as e:
@@ -331,20 +748,78 @@ class JetsonPlugin:
             return None
         
         try:
-            import Jetson.GPIO as GPIO
-            
-            value = GPIO.input(pin)
-            self.gpio_pins[pin]['state'] = value
+            value = self._gpio_input(pin)
+            self.gpio_states[pin] = value
             return value
             
         except Exception as e:
             logger.error(f"Failed to get GPIO value: {e}")
             return None
     
+    async def wait_gpio_edge(self, pin: int, edge: str = 'rising',
+                             timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Wait for an edge on a GPIO input pin without polling.
+        
+        Edge detection is interrupt-driven inside Jetson.GPIO; its callback
+        thread wakes the waiting coroutine, so nothing runs while the pin
+        is idle.
+        
+        Args:
+            pin: Pin number, set up as input with set_gpio_mode()
+            edge: Edge to wait for ('rising', 'falling' or 'both')
+            timeout: Maximum time to wait in seconds, or None to wait forever
+            
+        Returns:
+            Pin value (0 or 1) after the edge, or None on timeout or failure
+        """
+        if not self.jetson_initialized or pin not in self.gpio_pins:
+            return None
+        
+        if self.gpio_modes[pin] != _MODE_INPUT:
+            logger.error(f"Pin {pin} is not set as input")
+            return None
+        
+        edges = {'rising': _GPIO.RISING, 'falling': _GPIO.FALLING, 'both': _GPIO.BOTH}
+        if edge not in edges:
+            logger.error(f"Invalid GPIO edge: {edge}")
+            return None
+        
+        loop = asyncio.get_running_loop()
+        detected = loop.create_future()
+        
+        def _set_detected():
+            if not detected.done():
+                detected.set_result(None)
+        
+        def _on_edge(channel):
+            # Called on Jetson.GPIO's event thread
+            loop.call_soon_threadsafe(_set_detected)
+        
+        try:
+            _GPIO.add_event_detect(pin, edges[edge], callback=_on_edge)
+            try:
+                await asyncio.wait_for(detected, timeout)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                _GPIO.remove_event_detect(pin)
+            
+            value = self._gpio_input(pin)
+            self.gpio_states[pin] = value
+            return value
+            
+        except Exception as e:
+            logger.error(f"Failed to wait for GPIO edge: {e}")
+            return None
+    
     async def capture_image(self, camera_id: str, width: int = 640, height: int = 480) -> Optional[bytes]:
         """
         Capture an image from a camera.
         
+        The camera stays open between captures; release it with
+        close_camera().
+        
         Args:
             camera_id: Camera identifier
             width: Image width
@@ -356,42 +831,129 @@ class JetsonPlugin:
         if not self.jetson_initialized or camera_id not in self.camera_devices:
             return None
         
+        if _cv2 is None:
+            logger.error("OpenCV not found. Cannot capture image.")
+            return None
+        
         try:
-            # Try to use OpenCV
-            import cv2
-            
-            camera_path = self.camera_devices[camera_id]['path']
-            cap = cv2.VideoCapture(camera_path)
-            
-            # Set resolution
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            cap, encoded = self._open_camera(camera_id, width, height)
             
             # Capture frame
             ret, frame = cap.read()
             
-            # Release camera
-            cap.release()
-            
             if not ret:
                 logger.error(f"Failed to capture image from camera {camera_id}")
+                # Reopen on the next capture in case the device went away
+                await self.close_camera(camera_id)
                 return None
             
-            # Encode image as JPEG
-            _, img_encoded = cv2.imencode('.jpg', frame)
+            # Hardware-encoded frames arrive as JPEG bytes already
+            if encoded:
+                return frame.tobytes()
+            
+            # Encode image as JPEG, at OpenCV's default quality
+            if _turbojpeg is not None:
+                return _turbojpeg.encode(frame, quality=95, pixel_format=TJPF_BGR)
+            _, img_encoded = _cv2.imencode('.jpg', frame)
             return img_encoded.tobytes()
             
-        except ImportError:
-            logger.error("OpenCV not found. Cannot capture image.")
-            return None
         except Exception as e:
             logger.error(f"Failed to capture image: {e}")
             return None
     
+    def _open_camera(self, camera_id: str, width: int, height: int) -> Tuple[Any, bool]:
+        """
+        Get the open capture handle of a camera, opening it if needed.
+        
+        Cameras are opened through a GStreamer pipeline that JPEG-encodes
+        frames in hardware: nvarguscamerasrc for CSI cameras, v4l2src for
+        USB cameras. Cameras whose pipeline cannot be opened, for example
+        when OpenCV lacks GStreamer support or the camera only produces
+        compressed frames, fall back to OpenCV's V4L2 capture.
+        
+        Args:
+            camera_id: Camera identifier
+            width: Image width
+            height: Image height
+            
+        Returns:
+            Tuple of the OpenCV VideoCapture and whether its frames are
+            already JPEG-encoded
+        """
+        entry = self._captures.get(camera_id)
+        if entry is not None:
+            cap, resolution, encoded = entry
+            if resolution == (width, height):
+                return cap, encoded
+            # A device can only be opened once; reopen at the new resolution
+            cap.release()
+            del self._captures[camera_id]
+        
+        camera = self.camera_devices[camera_id]
+        
+        if camera_id not in self._software_cameras:
+            if camera['type'] == 'csi':
+                pipeline = _CSI_PIPELINE.format(sensor_id=camera['sensor_id'], width=width, height=height)
+            else:
+                pipeline = _V4L2_PIPELINE.format(path=camera['path'], width=width, height=height)
+            cap = _cv2.VideoCapture(pipeline, _cv2.CAP_GSTREAMER)
+            if cap.isOpened():
+                self._captures[camera_id] = (cap, (width, height), True)
+                return cap, True
+            cap.release()
+            # Do not retry the pipeline on later opens of this camera
+            self._software_cameras.add(camera_id)
+            logger.warning(f"Failed to open GStreamer pipeline for camera {camera_id}, using V4L2")
+        
+        cap = _cv2.VideoCapture(camera['path'])
+        
+        # Set resolution
+        cap.set(_cv2.CAP_PROP_FRAME_WIDTH, width)
+        cap.set(_cv2.CAP_PROP_FRAME_HEIGHT, height)
+        
+        # Keep only the latest frame queued so captures are not stale
+        cap.set(_cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        self._captures[camera_id] = (cap, (width, height), False)
+        return cap, False
+    
+    async def close_camera(self, camera_id: Optional[str] = None):
+        """
+        Release open camera devices.
+        
+        Args:
+            camera_id: Camera identifier, or None to release all cameras
+        """
+        camera_ids = list(self._captures) if camera_id is None else [camera_id]
+        for cid in camera_ids:
+            entry = self._captures.pop(cid, None)
+            if entry is not None:
+                entry[0].release()
+    
+    def _run_trt_engine(self, model_path: str, input_data: bytes) -> List[Any]:
+        """
+        Load a TensorRT engine if needed and run it (runs on the TensorRT thread).
+        
+        Args:
+            model_path: Path to the TensorRT model
+            input_data: Input data
+            
+        Returns:
+            Output tensors as flat numpy arrays
+        """
+        engine = self._trt_engines.get(model_path)
+        if engine is None:
+            engine = self._trt_engines[model_path] = _TrtEngine(model_path)
+        return engine.infer(input_data)
+    
     async def run_inference(self, model_path: str, input_data: bytes) -> Optional[Dict[str, Any]]:
         """
         Run inference using TensorRT.
         
+        Each engine is deserialized once and kept with its execution
+        context and I/O buffers for later calls. Loading and inference run
+        on a dedicated thread so the event loop is not blocked.
+        
         Args:
             model_path: Path to the TensorRT model
             input_data: Input data
@@ -403,8 +965,19 @@ class JetsonPlugin:
             return None
         
         try:
-            # This is a simplified example. In a real implementation,
-            # you would use TensorRT Python API to load the model and run inference.
+            if _trt is not None:
+                if self._trt_executor is None:
+                    self._trt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jetson-trt')
+                outputs = await asyncio.get_running_loop().run_in_executor(
+                    self._trt_executor, self._run_trt_engine, model_path, input_data
+                )
+                return {
+                    'status': 'success',
+                    'model': model_path,
+                    'results': [output.tolist() for output in outputs]
+                }
+            
+            # Without TensorRT and PyCUDA only placeholder results are available
             logger.warning("TensorRT inference not fully implemented in this example")
             
             # Placeholder for inference results
@@ -20,6 +20,13 @@ logger = logging.getLogger(__name__)
 # Import base plugin class
 from .base import DevicePlugin
 
+# BCM pins wired to the hardware PWM peripheral
+_HARDWARE_PWM_PINS = frozenset({12, 13, 18, 19})
+
+# GPIO edge events waiting to be emitted; edges are dropped rather than
+# buffered without bound when listeners fall behind
+_EDGE_QUEUE_SIZE = 4096
+
 class RaspberryPiPlugin(DevicePlugin):
     """Raspberry Pi plugin for ReGenNexus Core."""
     
@@ -36,6 +43,12 @@ class RaspberryPiPlugin(DevicePlugin):
         self.camera_active = False
         self.sensors = {}
         self.gpio_module = None
+        # pigpio daemon connection; preferred over RPi.GPIO when available
+        self.pi = None
+        # Watched pins and their pigpio callbacks (None with RPi.GPIO)
+        self._gpio_watches: Dict[int, Any] = {}
+        self._edge_queue: Optional[asyncio.Queue] = None
+        self._edge_worker: Optional[asyncio.Task] = None
         self.camera_module = None
     
     async def initialize(self) -> bool:
@@ -48,20 +61,40 @@ class RaspberryPiPlugin(DevicePlugin):
         try:
             # Try to import Raspberry Pi specific modules
             try:
-                # Import GPIO module
-                import RPi.GPIO as GPIO
-                self.gpio_module = GPIO
-                self.gpio_module.setmode(GPIO.BCM)
-                logger.info("Initialized Raspberry Pi GPIO module")
-                
+                # Prefer pigpio, which accesses the GPIO registers directly
+                import pigpio
+                pi = pigpio.pi()
+                if pi.connected:
+                    self.pi = pi
+                    self.gpio_module = pigpio
+                    logger.info("Initialized pigpio GPIO access")
+                    
+                    # Banked access is only available through pigpio
+                    self.capabilities.add('gpio.bank')
+                else:
+                    pi.stop()
+                    logger.info("pigpio daemon not running, falling back to RPi.GPIO")
+            except ImportError:
+                pass
+            
+            if self.pi is None:
+                try:
+                    # Import GPIO module
+                    import RPi.GPIO as GPIO
+                    self.gpio_module = GPIO
+                    self.gpio_module.setmode(GPIO.BCM)
+                    logger.info("Initialized Raspberry Pi GPIO module")
+                except ImportError:
+                    logger.warning("RPi.GPIO module not available, GPIO functionality disabled")
+            
+            if self.gpio_module:
                 # Add GPIO capabilities
-                self.capabilities.extend([
+                self.capabilities.update((
                     'gpio.read',
                     'gpio.write',
-                    'gpio.pwm'
-                ])
-            except ImportError:
-                logger.warning("RPi.GPIO module not available, GPIO functionality disabled")
+                    'gpio.pwm',
+                    'gpio.watch'
+                ))
             
             try:
                 # Import camera module
@@ -70,11 +103,11 @@ class RaspberryPiPlugin(DevicePlugin):
                 logger.info("Initialized Raspberry Pi camera module")
                 
                 # Add camera capabilities
-                self.capabilities.extend([
+                self.capabilities.update((
                     'camera.capture',
                     'camera.record',
                     'camera.stream'
-                ])
+                ))
             except ImportError:
                 logger.warning("picamera module not available, camera functionality disabled")
             
@@ -82,6 +115,8 @@ class RaspberryPiPlugin(DevicePlugin):
             self.register_command_handler('gpio.read', self._handle_gpio_read)
             self.register_command_handler('gpio.write', self._handle_gpio_write)
             self.register_command_handler('gpio.pwm', self._handle_gpio_pwm)
+            self.register_command_handler('gpio.bank', self._handle_gpio_bank)
+            self.register_command_handler('gpio.watch', self._handle_gpio_watch)
             self.register_command_handler('camera.capture', self._handle_camera_capture)
             self.register_command_handler('camera.record', self._handle_camera_record)
             self.register_command_handler('camera.stream', self._handle_camera_stream)
@@ -91,6 +126,7 @@ class RaspberryPiPlugin(DevicePlugin):
             self.metadata.update({
                 'device_type': 'raspberry_pi',
                 'gpio_available': self.gpio_module is not None,
+                'gpio_backend': 'pigpio' if self.pi else ('RPi.GPIO' if self.gpio_module else None),
                 'camera_available': self.camera_module is not None,
                 'model': self._get_pi_model()
             })
@@ -113,8 +149,22 @@ class RaspberryPiPlugin(DevicePlugin):
             Boolean indicating success
         """
         try:
+            # Stop edge detection
+            for pin in list(self._gpio_watches):
+                self._unwatch_gpio(pin)
+            if self._edge_worker:
+                self._edge_worker.cancel()
+                self._edge_worker = None
+            
             # Clean up GPIO
-            if self.gpio_module:
+            if self.pi:
+                # Stop PWM output started by this plugin
+                for pin, state in self.gpio_state.items():
+                    if state['mode'] == 'pwm':
+                        self.pi.write(pin, 0)
+                self.pi.stop()
+                self.pi = None
+            elif self.gpio_module:
                 self.gpio_module.cleanup()
             
             # Clean up camera
@@ -189,14 +239,20 @@ class RaspberryPiPlugin(DevicePlugin):
             
             # Set up pin as input if not already
             if pin not in self.gpio_state:
-                self.gpio_module.setup(pin, self.gpio_module.IN)
+                if self.pi:
+                    self.pi.set_mode(pin, self.gpio_module.INPUT)
+                else:
+                    self.gpio_module.setup(pin, self.gpio_module.IN)
                 self.gpio_state[pin] = {
                     'mode': 'input',
                     'value': None
                 }
             
             # Read pin
-            value = self.gpio_module.input(pin)
+            if self.pi:
+                value = self.pi.read(pin)
+            else:
+                value = self.gpio_module.input(pin)
             self.gpio_state[pin]['value'] = value
             
             return {
@@ -239,17 +295,26 @@ class RaspberryPiPlugin(DevicePlugin):
                     'error': "Missing pin or value parameter"
                 }
             
-            # Set up pin as output
-            self.gpio_module.setup(pin, self.gpio_module.OUT)
+            # Set up pin as output unless it already is one
+            state = self.gpio_state.get(pin)
+            if state is None or state['mode'] != 'output':
+                if self.pi:
+                    self.pi.set_mode(pin, self.gpio_module.OUTPUT)
+                else:
+                    self.gpio_module.setup(pin, self.gpio_module.OUT)
+                state = self.gpio_state[pin] = {
+                    'mode': 'output',
+                    'value': None
+                }
             
             # Write value
-            self.gpio_module.output(pin, value)
+            if self.pi:
+                self.pi.write(pin, value)
+            else:
+                self.gpio_module.output(pin, value)
             
             # Update state
-            self.gpio_state[pin] = {
-                'mode': 'output',
-                'value': value
-            }
+            state['value'] = value
             
             return {
                 'success': True,
@@ -293,14 +358,31 @@ class RaspberryPiPlugin(DevicePlugin):
                     'error': "Missing pin parameter"
                 }
             
-            # Set up pin as output
-            self.gpio_module.setup(pin, self.gpio_module.OUT)
-            
-            # Create PWM instance
-            pwm = self.gpio_module.PWM(pin, frequency)
-            
-            # Start PWM
-            pwm.start(duty_cycle)
+            state = self.gpio_state.get(pin)
+            
+            if self.pi:
+                if pin in _HARDWARE_PWM_PINS:
+                    # Hardware-timed PWM; duty cycle is in millionths
+                    self.pi.hardware_PWM(pin, frequency, int(duty_cycle * 10000))
+                else:
+                    # DMA-timed PWM on other pins; duty cycle is out of 255
+                    self.pi.set_PWM_frequency(pin, frequency)
+                    self.pi.set_PWM_dutycycle(pin, int(duty_cycle * 255 / 100))
+                pwm = None
+            elif state is not None and state['mode'] == 'pwm':
+                # Adjust the running PWM instance; RPi.GPIO allows only one per pin
+                pwm = state['pwm']
+                pwm.ChangeFrequency(frequency)
+                pwm.ChangeDutyCycle(duty_cycle)
+            else:
+                # Set up pin as output
+                self.gpio_module.setup(pin, self.gpio_module.OUT)
+                
+                # Create PWM instance
+                pwm = self.gpio_module.PWM(pin, frequency)
+                
+                # Start PWM
+                pwm.start(duty_cycle)
             
             # Update state
             self.gpio_state[pin] = {
@@ -324,6 +406,187 @@ class RaspberryPiPlugin(DevicePlugin):
                 'error': str(e)
             }
     
+    async def _handle_gpio_bank(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle GPIO bank command, reading or writing GPIO 0-31 at once.
+        
+        Without bits, the levels of all pins in the bank are read; with
+        bits, the pins selected by mask are set or cleared to match.
+        
+        Args:
+            params: Command parameters (bits, mask)
+            
+        Returns:
+            Bank levels or command result
+        """
+        try:
+            # Check if banked access is available
+            if not self.pi:
+                return {
+                    'success': False,
+                    'error': "Banked GPIO access requires pigpio"
+                }
+            
+            bits = params.get('bits')
+            mask = params.get('mask', 0xFFFFFFFF)
+            
+            if bits is None:
+                return {
+                    'success': True,
+                    'bits': self.pi.read_bank_1() & mask
+                }
+            
+            # One call sets the selected high pins, one clears the low ones
+            self.pi.set_bank_1(bits & mask)
+            self.pi.clear_bank_1(~bits & mask)
+            
+            return {
+                'success': True,
+                'bits': bits & mask,
+                'mask': mask
+            }
+            
+        except Exception as e:
+            logger.error(f"Error accessing GPIO bank: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    async def _handle_gpio_watch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle GPIO watch command.
+        
+        Edges on a watched pin are detected by pigpio or RPi.GPIO in their
+        own thread and emitted as 'gpio.edge' events (pin, level, tick)
+        from the event loop, so no Python code polls the pin. The tick is
+        pigpio's microsecond timestamp of the edge, or a monotonic
+        microsecond timestamp taken when RPi.GPIO reports it.
+        
+        Args:
+            params: Command parameters (pin, edge, enable)
+            
+        Returns:
+            Command result
+        """
+        try:
+            # Check if GPIO is available
+            if not self.gpio_module:
+                return {
+                    'success': False,
+                    'error': "GPIO module not available"
+                }
+            
+            # Get parameters
+            pin = params.get('pin')
+            edge = params.get('edge', 'both')
+            enable = params.get('enable', True)
+            
+            if pin is None:
+                return {
+                    'success': False,
+                    'error': "Missing pin parameter"
+                }
+            
+            if edge not in ('rising', 'falling', 'both'):
+                return {
+                    'success': False,
+                    'error': f"Invalid edge: {edge}"
+                }
+            
+            # Replace any existing watch on the pin
+            self._unwatch_gpio(pin)
+            if not enable:
+                return {
+                    'success': True,
+                    'pin': pin,
+                    'watching': False
+                }
+            
+            if self._edge_worker is None:
+                self._edge_queue = asyncio.Queue(_EDGE_QUEUE_SIZE)
+                self._edge_worker = asyncio.create_task(self._edge_event_worker())
+            
+            loop = asyncio.get_running_loop()
+            
+            def _queue_edge(event):
+                try:
+                    self._edge_queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning(f"GPIO edge queue full, dropping edge on pin {event[0]}")
+            
+            if self.pi:
+                pigpio = self.gpio_module
+                edges = {'rising': pigpio.RISING_EDGE, 'falling': pigpio.FALLING_EDGE,
+                         'both': pigpio.EITHER_EDGE}
+                
+                def _on_edge(gpio, level, tick):
+                    # Called on pigpio's notification thread
+                    loop.call_soon_threadsafe(_queue_edge, (gpio, level, tick))
+                
+                self.pi.set_mode(pin, pigpio.INPUT)
+                self._gpio_watches[pin] = self.pi.callback(pin, edges[edge], _on_edge)
+            else:
+                GPIO = self.gpio_module
+                edges = {'rising': GPIO.RISING, 'falling': GPIO.FALLING, 'both': GPIO.BOTH}
+                
+                def _on_edge(channel):
+                    # Called on RPi.GPIO's event thread
+                    event = (channel, GPIO.input(channel), time.monotonic_ns() // 1000)
+                    loop.call_soon_threadsafe(_queue_edge, event)
+                
+                GPIO.setup(pin, GPIO.IN)
+                GPIO.add_event_detect(pin, edges[edge], callback=_on_edge)
+                self._gpio_watches[pin] = None
+            
+            self.gpio_state[pin] = {
+                'mode': 'input',
+                'value': None
+            }
+            
+            return {
+                'success': True,
+                'pin': pin,
+                'edge': edge,
+                'watching': True
+            }
+            
+        except Exception as e:
+            logger.error(f"Error watching GPIO: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _unwatch_gpio(self, pin: int) -> None:
+        """
+        Stop edge detection on a pin if it is watched.
+        
+        Args:
+            pin: Pin number
+        """
+        if pin not in self._gpio_watches:
+            return
+        callback = self._gpio_watches.pop(pin)
+        if callback is not None:
+            callback.cancel()
+        else:
+            self.gpio_module.remove_event_detect(pin)
+    
+    async def _edge_event_worker(self) -> None:
+        """Emit queued GPIO edges as events until the plugin shuts down."""
+        get = self._edge_queue.get
+        while True:
+            pin, level, tick = await get()
+            state = self.gpio_state.get(pin)
+            if state is not None:
+                state['value'] = level
+            await self.emit_event('gpio.edge', {
+                'pin': pin,
+                'level': level,
+                'tick': tick
+            })
+    
     async def _handle_camera_capture(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle camera capture command.
@@ -524,9 +787,8 @@ class RaspberryPiPlugin(DevicePlugin):
             }
             
             # Add to capabilities
-            capability = f'sensor.{sensor_type}'
-            if capability not in self.capabilities:
-                self.capabilities.append(capability)
+            self.capabilities.add(f'sensor.{sensor_type}')
+            self._capabilities_changed()
             
             logger.info(f"Registered sensor: {sensor_type}")
             return True
@@ -23,6 +23,9 @@ class Message:
     Messages are the primary means of communication between entities.
     """
     
+    __slots__ = ("id", "sender_id", "recipient_id", "content", "intent",
+                 "context_id", "metadata", "timestamp")
+    
     def __init__(self, 
                  sender_id: str, 
                  recipient_id: str, 
@@ -275,6 +278,21 @@ class ProtocolCore:
         if entity_id in self.entities:
             del self.entities[entity_id]
             logger.info(f"Entity unregistered: {entity_id}")
+    
+    async def get_entity(self, entity_id: str) -> Optional[Entity]:
+        """
+        Look up a registered entity by identifier.
+        
+        Entities are keyed by ID, so this is a constant-time lookup; callers
+        should prefer it over scanning the registered entities.
+        
+        Args:
+            entity_id: Identifier of the entity
+            
+        Returns:
+            The registered entity, or None if not found
+        """
+        return self.entities.get(entity_id)
         
     async def route_message(self, message: Message, context: Optional[Dict[str, Any]] = None) -> Optional[Message]:
         """
@@ -287,11 +305,11 @@ class ProtocolCore:
         Returns:
             Optional response message
         """
-        if message.recipient_id not in self.entities:
+        recipient = self.entities.get(message.recipient_id)
+        if recipient is None:
             logger.warning(f"Recipient not found: {message.recipient_id}")
             return None
         
-        recipient = self.entities[message.recipient_id]
         ctx = context or {}
         
         logger.debug(f"Routing message: {message.id} from {message.sender_id} to {message.recipient_id}")
@@ -308,10 +326,10 @@ class ProtocolCore:
         Returns:
             Encrypted message data
         """
-        if recipient_id not in self.entities:
+        recipient = self.entities.get(recipient_id)
+        if recipient is None:
             raise ValueError(f"Recipient not found: {recipient_id}")
         
-        recipient = self.entities[recipient_id]
         recipient_public_key = recipient.get_public_key()
         
         # Use ECDH-384 if available, fall back to RSA for backward compatibility
@@ -337,9 +355,9 @@ class ProtocolCore:
         Returns:
             Decrypted message
         """
-        if entity_id not in self.entities:
+        entity = self.entities.get(entity_id)
+        if entity is None:
             raise ValueError(f"Entity not found: {entity_id}")
         
-        entity = self.entities[entity_id]
         decrypted_data = await entity.security_manager.decrypt_message(encrypted_data)
         return Message.deserialize(decrypted_data.decode('utf-8'))
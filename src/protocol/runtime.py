@@ -0,0 +1,30 @@
+"""
+ReGenNexus Core - Runtime Module
+
+This module provides helpers for configuring the asyncio runtime used by
+ReGenNexus Core applications, bridges and plugins.
+"""
+
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop implementation if it is installed.
+    
+    Must be called before the event loop is created (e.g. before asyncio.run).
+    
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using the default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True